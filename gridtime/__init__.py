@@ -1,4 +1,6 @@
 #__init__.py
+import os
+
 from gridtime.gridtime import (
     QuarterHour,
     Hour,
@@ -8,6 +10,8 @@ from gridtime.gridtime import (
     Year,
     Week,
     Season,
+    SlotUnit,
+    fixed_resolution_unit,
     create_hours,
     create_days,
     create_months,
@@ -19,6 +23,19 @@ from gridtime.gridtime import (
     )
 
 from gridtime.utils import _GRIDTIME_REGISTRY, register_unit, _all_unit_keys, _is_reachable, is_duplicated_hour, is_duplicated_quarter, is_missing_hour, is_missing_quarter
+from gridtime.slots import day_slot_count, dst_transition_days, slot_ordinal, slot_start
+from gridtime.holidays import easter_sunday, is_holiday, polish_holidays
+from gridtime.filters import SlotFilter
+from gridtime.cache import NodeCache, node_cache
+from gridtime.completeness import CompletenessChecker, CompletenessReport, completeness
+from gridtime.align import align, broadcast, combine
+from gridtime.rolling import rolling, window_slots
+from gridtime.slotset import SlotSet
+from gridtime.overlap import overlap_weights, units_between
+from gridtime.labels import format_labels
+from gridtime.durations import boundaries, durations, slot_counts, span_count
+from gridtime.tariffs import TARIFFS, CompiledTariff, Tariff, ZoneRule
+from gridtime.snapshot import Snapshot, active_snapshot, build_snapshot, load_snapshot, use_snapshot
 
 __all__ = [
     "QuarterHour",
@@ -29,6 +46,8 @@ __all__ = [
     "Year",
     "Week",
     "Season",
+    "SlotUnit",
+    "fixed_resolution_unit",
     "create_hours",
     "create_days",
     "create_months",
@@ -44,5 +63,43 @@ __all__ = [
     "is_duplicated_hour",
     "is_duplicated_quarter",
     "is_missing_hour",
-    "is_missing_quarter"
+    "is_missing_quarter",
+    "day_slot_count",
+    "dst_transition_days",
+    "slot_ordinal",
+    "slot_start",
+    "easter_sunday",
+    "is_holiday",
+    "polish_holidays",
+    "TARIFFS",
+    "CompiledTariff",
+    "Tariff",
+    "ZoneRule",
+    "SlotFilter",
+    "NodeCache",
+    "node_cache",
+    "CompletenessChecker",
+    "CompletenessReport",
+    "completeness",
+    "align",
+    "broadcast",
+    "combine",
+    "rolling",
+    "window_slots",
+    "SlotSet",
+    "overlap_weights",
+    "units_between",
+    "format_labels",
+    "Snapshot",
+    "active_snapshot",
+    "build_snapshot",
+    "load_snapshot",
+    "use_snapshot",
+    "boundaries",
+    "durations",
+    "slot_counts",
+    "span_count",
 ]
+
+if os.environ.get("GRIDTIME_SNAPSHOT"):
+    use_snapshot(load_snapshot(os.environ["GRIDTIME_SNAPSHOT"]))
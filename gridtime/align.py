@@ -0,0 +1,71 @@
+# align.py
+"""
+Łączenie danych o różnej rozdzielczości (Hour ↔ QuarterHour ↔ Day/Month).
+
+Serie to zwykłe sekwencje wartości ułożone w kolejności slotów jednostki
+`over` (Day, Month, Year …).  Rozwinięcie na drobniejszą siatkę korzysta
+z relacji rodzic–dziecko na ordynałach (`gridtime.slots`) – każda wartość
+jest powielana tyle razy, ile drobnych slotów obejmuje jej slot, bez
+tworzenia obiektów slotów.  Zduplikowana godzina październikowa trafia
+więc na własne cztery kwadranse, a nie na kwadranse drugiego egzemplarza.
+"""
+import operator
+from itertools import chain, repeat
+from typing import Callable, Sequence
+
+from gridtime.utils import _fixed_resolution, _unit_resolution
+
+def _slot_counts(over, src_unit: str, dst_unit: str) -> list[int]:
+    """Liczba slotów `dst_unit` w każdym kolejnym slocie `src_unit` jednostki `over`."""
+    dst_minutes = _fixed_resolution(dst_unit)
+
+    src_minutes = _unit_resolution(src_unit)
+    if src_minutes is None:
+        return [len(node.slot_range(dst_unit)) for node in over.walk(src_unit)]
+
+    if src_minutes % dst_minutes:
+        raise ValueError(f"Jednostka '{src_unit}' nie dzieli się na sloty '{dst_unit}'")
+    return [src_minutes // dst_minutes] * len(over.slot_range(src_unit))
+
+def broadcast(values: Sequence, over, src_unit: str, dst_unit: str) -> list:
+    """
+    Rozwija wartości per `src_unit` (np. ceny godzinowe, współczynniki
+    dobowe) na sloty `dst_unit` (np. kwadranse) w obrębie `over`.
+    """
+    counts = _slot_counts(over, src_unit, dst_unit)
+    if len(values) != len(counts):
+        raise ValueError(
+            f"Oczekiwano {len(counts)} wartości '{src_unit}' dla {over!r}, otrzymano {len(values)}"
+        )
+    return list(chain.from_iterable(map(repeat, values, counts)))
+
+def _finer_unit(left_unit: str, right_unit: str) -> str:
+    left, right = _unit_resolution(left_unit), _unit_resolution(right_unit)
+    if left is None and right is None:
+        raise ValueError("Co najmniej jedna z serii musi mieć stałą rozdzielczość")
+    if right is None or (left is not None and left <= right):
+        return left_unit
+    return right_unit
+
+def align(left: Sequence, left_unit: str, right: Sequence, right_unit: str, over) -> tuple[list, list, str]:
+    """
+    Sprowadza dwie serie do wspólnej (drobniejszej) rozdzielczości.
+    Zwraca (lewa, prawa, klucz_jednostki_wspólnej).
+    """
+    unit = _finer_unit(left_unit, right_unit)
+    return broadcast(left, over, left_unit, unit), broadcast(right, over, right_unit, unit), unit
+
+def combine(
+    left: Sequence,
+    left_unit: str,
+    right: Sequence,
+    right_unit: str,
+    over,
+    op: Callable = operator.mul,
+) -> list:
+    """
+    Łączy dwie serie slot po slocie po wyrównaniu rozdzielczości, np.
+    ceny godzinowe × wolumeny kwadransowe ➜ wartości kwadransowe.
+    """
+    left_values, right_values, _ = align(left, left_unit, right, right_unit, over)
+    return list(map(op, left_values, right_values))
@@ -0,0 +1,81 @@
+# cache.py
+"""
+Wspólny, ograniczony rozmiarem cache węzłów (LRU).
+
+Funkcje `create_days`, `create_week_days`, `create_decade_days` i
+`create_hours` pobierają `Day`/`Hour` przez `node_cache`, więc nakładające
+się struktury (Week, Month, MonthDecade) dzielą te same instancje wraz
+z ich poddrzewami.  Rozmiar liczony jest w liczbie wpisów.
+"""
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+NodeCacheInfo = namedtuple("NodeCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+DEFAULT_MAXSIZE = 10_000
+
+class NodeCache:
+    """LRU z licznikami trafień; `maxsize=0` wyłącza przechowywanie węzłów."""
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize < 0:
+            raise ValueError("maxsize nie może być ujemny")
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        with self._lock:
+            node = self._data.get(key)
+            if node is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return node  # type: ignore
+            self.misses += 1
+
+        node = factory()
+        with self._lock:
+            # inny wątek mógł w międzyczasie wstawić ten sam węzeł
+            existing = self._data.get(key)
+            if existing is not None:
+                return existing  # type: ignore
+            if self._maxsize:
+                self._data[key] = node
+                self._evict()
+        return node
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """Zmienia limit; nadmiarowe, najdawniej używane wpisy są usuwane."""
+        if maxsize < 0:
+            raise ValueError("maxsize nie może być ujemny")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Usuwa wszystkie wpisy i zeruje statystyki."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> NodeCacheInfo:
+        with self._lock:
+            return NodeCacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+node_cache = NodeCache()
@@ -0,0 +1,115 @@
+# completeness.py
+"""
+Kontrola kompletności danych względem oczekiwanej siatki slotów.
+
+Każdy rekord jest mapowany na ordynał slotu (`gridtime.slots`) i zaznaczany
+w bitmapie o rozmiarze równym liczbie slotów jednostki nadrzędnej – całość
+działa w czasie liniowym i w jednym przebiegu, więc nadaje się do strumieni.
+
+Akceptowane znaczniki czasu:
+  • jednostka o kluczu `unit` (np. QuarterHour) lub jej ordynał (int),
+  • datetime ze strefą – przeliczany przez UTC (rozróżnia ↑1st / ↓2nd),
+  • naiwny datetime w czasie lokalnym – `fold=1` oznacza drugi egzemplarz.
+"""
+from datetime import datetime
+from typing import Iterable
+
+from gridtime.slots import slot_ordinal, utc_to_local
+from gridtime.utils import _fixed_resolution, _unit_class
+
+class CompletenessReport:
+    """Wynik kontroli: brakujące, zduplikowane i spoza zakresu sloty."""
+    def __init__(self, parent, unit: str, missing: list[int], duplicates: dict[int, int],
+                 out_of_range: list, invalid: list):
+        self.parent = parent
+        self.unit = unit
+        self.missing = missing            # ordynały bez rekordu
+        self.duplicates = duplicates      # ordynał ➜ liczba wystąpień (> 1)
+        self.out_of_range = out_of_range  # poprawne sloty spoza jednostki nadrzędnej
+        self.invalid = invalid            # znaczniki, które nie są początkiem slotu
+
+    @property
+    def is_complete(self) -> bool:
+        return not (self.missing or self.duplicates or self.out_of_range or self.invalid)
+
+    def missing_slots(self) -> list:
+        """Brakujące sloty jako obiekty jednostki `unit`."""
+        cls = _unit_class(self.unit)
+        return [cls.from_ordinal(o) for o in self.missing]
+
+    def __repr__(self) -> str:
+        return (
+            f"CompletenessReport({self.parent!r}, missing={len(self.missing)}, "
+            f"duplicates={len(self.duplicates)}, out_of_range={len(self.out_of_range)}, "
+            f"invalid={len(self.invalid)})"
+        )
+
+class CompletenessChecker:
+    """
+    Przyrostowa kontrola kompletności – rekordy można podawać partiami
+    (`add` / `update`), a raport pobrać w dowolnym momencie.
+    """
+    def __init__(self, parent, unit: str = "quarters15"):
+        minutes = _fixed_resolution(unit)
+        self.parent = parent
+        self.unit = unit
+        self.minutes = minutes
+        self.slots = parent.slot_range(unit)
+        self._seen = bytearray(len(self.slots))
+        self._duplicates: dict[int, int] = {}
+        self._out_of_range: list = []
+        self._invalid: list = []
+
+    def _ordinal(self, stamp) -> int:
+        if stamp is None:
+            raise ValueError("Brak znacznika czasu")
+        if isinstance(stamp, int):
+            return stamp
+        if isinstance(stamp, datetime):
+            if stamp.tzinfo is not None:
+                local, is_backward = utc_to_local(stamp)
+            else:
+                local, is_backward = stamp, bool(stamp.fold)
+            return slot_ordinal(local, is_backward, self.minutes)
+        return stamp.ordinal()
+
+    def add(self, stamp) -> None:
+        # jednostka innej rozdzielczości to błąd wywołującego, nie brak danych
+        if hasattr(stamp, "unit_key") and stamp.unit_key() != self.unit:
+            raise ValueError(f"Oczekiwano jednostki '{self.unit}', otrzymano '{stamp.unit_key()}'")
+        try:
+            ordinal = self._ordinal(stamp)
+        except ValueError:
+            self._invalid.append(stamp)
+            return
+        index = ordinal - self.slots.start
+        if not 0 <= index < len(self._seen):
+            self._out_of_range.append(stamp)
+        elif self._seen[index]:
+            self._duplicates[ordinal] = self._duplicates.get(ordinal, 1) + 1
+        else:
+            self._seen[index] = 1
+
+    def update(self, stamps: Iterable) -> "CompletenessChecker":
+        for stamp in stamps:
+            self.add(stamp)
+        return self
+
+    def report(self) -> CompletenessReport:
+        missing: list[int] = []
+        seen, start = self._seen, self.slots.start
+        index = seen.find(0)
+        while index != -1:
+            missing.append(start + index)
+            index = seen.find(0, index + 1)
+        return CompletenessReport(
+            self.parent, self.unit, missing, dict(self._duplicates),
+            list(self._out_of_range), list(self._invalid),
+        )
+
+def completeness(parent, timestamps: Iterable, unit: str = "quarters15") -> CompletenessReport:
+    """
+    Sprawdza, czy każdy slot `unit` jednostki `parent` (Day, Month, …)
+    występuje w `timestamps` dokładnie raz.
+    """
+    return CompletenessChecker(parent, unit).update(timestamps).report()
@@ -0,0 +1,49 @@
+# durations.py
+"""
+Liczby slotów i czasy trwania dla ciągów kolejnych jednostek.
+
+Kolejne jednostki jednej rodziny stykają się granicami, więc koniec
+jednej jest początkiem następnej – dla n jednostek wyznaczanych jest
+n + 1 granic (ordynałów), a nie 2n.
+"""
+from datetime import timedelta
+
+from gridtime.slots import day_first_ordinal
+from gridtime.utils import _fixed_resolution, _unit_resolution
+
+def boundaries(first, n: int, unit: str = "hours") -> list[int]:
+    """Ordynały granic n kolejnych jednostek, zaczynając od `first` (n + 1 wartości)."""
+    minutes = _fixed_resolution(unit)
+    start = first.slot_range(unit).start
+    own = _unit_resolution(first.unit_key())
+    if own is not None:
+        ratio = len(first.slot_range(unit))
+        return [start + i * ratio for i in range(n + 1)]
+
+    out = [start]
+    node = first
+    for i in range(n):
+        out.append(day_first_ordinal(node._date_range()[1], minutes))
+        if i + 1 < n:
+            node = node.next()
+    return out
+
+def slot_counts(first, n: int, unit: str = "hours") -> list[int]:
+    """Liczba slotów `unit` w każdej z n kolejnych jednostek (np. 12 miesięcy)."""
+    edges = boundaries(first, n, unit)
+    return [b - a for a, b in zip(edges, edges[1:])]
+
+def durations(first, n: int) -> list[timedelta]:
+    """
+    Rzeczywiste czasy trwania n kolejnych jednostek – stałe dla jednostek
+    o stałej rozdzielczości, a dla kalendarzowych (złożonych z pełnych
+    godzin) liczone w slotach godzinowych.
+    """
+    own = _unit_resolution(first.unit_key())
+    if own is not None:
+        return [timedelta(minutes=own)] * n
+    return [timedelta(hours=count) for count in slot_counts(first, n, "hours")]
+
+def span_count(first, last, unit: str = "hours") -> int:
+    """Liczba slotów `unit` od początku `first` do końca `last` włącznie – O(1)."""
+    return last.slot_range(unit).stop - first.slot_range(unit).start
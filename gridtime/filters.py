@@ -0,0 +1,131 @@
+# filters.py
+"""
+Filtry slotów dla `walk(unit, where=...)`.
+
+Każdy węzeł drzewa jest najpierw sprawdzany po swoich granicach
+(`may_contain`) – gałęzie, które nie mogą zawierać pasujących slotów,
+są pomijane bez tworzenia ich dzieci.  Zwracane węzły sprawdza `matches`.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional, Union
+
+from gridtime.slots import DST_HOUR, dst_transition_days
+from gridtime.utils import _unit_resolution
+
+DateLike = Union[date, datetime]
+
+def _as_datetime(value: DateLike) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time(0))
+
+class SlotFilter:
+    """
+    Filtr strukturalny (wszystkie podane warunki muszą być spełnione):
+      • `weekdays`   – dni tygodnia (0 = poniedziałek … 6 = niedziela),
+      • `hours`      – godziny doby początku slotu (0–23),
+      • `months`     – miesiące (1–12),
+      • `start`/`stop` – przedział [start, stop) dat lub chwil,
+      • `duplicated` – tylko sloty zduplikowane (True) / niezduplikowane (False),
+      • `backward`   – tylko drugie (True) / pierwsze (False) egzemplarze duplikatów.
+
+    Przykład – dni robocze 07:00–22:00 w I kwartale:
+        SlotFilter(weekdays=range(5), hours=range(7, 22), months=(1, 2, 3))
+    """
+    def __init__(
+        self,
+        *,
+        weekdays: Optional[Iterable[int]] = None,
+        hours: Optional[Iterable[int]] = None,
+        months: Optional[Iterable[int]] = None,
+        start: Optional[DateLike] = None,
+        stop: Optional[DateLike] = None,
+        duplicated: Optional[bool] = None,
+        backward: Optional[bool] = None,
+    ):
+        self.weekdays = None if weekdays is None else frozenset(weekdays)
+        self.hours = None if hours is None else frozenset(hours)
+        self.months = None if months is None else frozenset(months)
+        self.start = None if start is None else _as_datetime(start)
+        self.stop = None if stop is None else _as_datetime(stop)
+        self.duplicated = duplicated
+        self.backward = backward
+
+        if self.weekdays is not None and not self.weekdays <= set(range(7)):
+            raise ValueError("Dni tygodnia muszą być z zakresu 0–6")
+        if self.hours is not None and not self.hours <= set(range(24)):
+            raise ValueError("Godziny muszą być z zakresu 0–23")
+        if self.months is not None and not self.months <= set(range(1, 13)):
+            raise ValueError("Miesiące muszą być z zakresu 1–12")
+
+    # ── węzły kalendarzowe ─────────────────────────────────────────────────
+    def _days_may_match(self, first: date, stop: date) -> bool:
+        """Czy dni z [first, stop) mogą zawierać pasujący slot?"""
+        if self.start is not None and _as_datetime(stop) <= self.start:
+            return False
+        if self.stop is not None and _as_datetime(first) >= self.stop:
+            return False
+
+        span = (stop - first).days
+        if self.weekdays is not None and span < 7:
+            if not any((first + timedelta(days=i)).weekday() in self.weekdays for i in range(span)):
+                return False
+
+        if self.months is not None and span < 366:
+            months, cursor = set(), first
+            while cursor < stop and len(months) < 12:
+                months.add(cursor.month)
+                cursor = (cursor.replace(day=1) + timedelta(days=32)).replace(day=1)
+            if not months & self.months:
+                return False
+
+        if self.duplicated or self.backward:
+            if not any(first <= dst_transition_days(y)[1] < stop for y in range(first.year, stop.year + 1)):
+                return False
+
+        if self.hours is not None:
+            hours = self.hours
+            if span == 1 and first == dst_transition_days(first.year)[0]:
+                hours = hours - {DST_HOUR}
+            if self.duplicated or self.backward:
+                hours = hours & {DST_HOUR}
+            if not hours:
+                return False
+        return True
+
+    # ── sloty (Hour, QuarterHour, …) ───────────────────────────────────────
+    def _slot_matches(self, node, whole: bool) -> bool:
+        start: datetime = node.start_time
+        if whole:
+            if self.start is not None and start < self.start:
+                return False
+            if self.stop is not None and start >= self.stop:
+                return False
+        else:
+            if self.start is not None and node.end_time <= self.start:
+                return False
+            if self.stop is not None and start >= self.stop:
+                return False
+        if self.weekdays is not None and start.weekday() not in self.weekdays:
+            return False
+        if self.hours is not None and start.hour not in self.hours:
+            return False
+        if self.months is not None and start.month not in self.months:
+            return False
+        if self.duplicated is not None and node.is_duplicated != self.duplicated:
+            return False
+        if self.backward is not None and node.is_backward != self.backward:
+            return False
+        return True
+
+    def may_contain(self, node) -> bool:
+        """Czy poddrzewo `node` może zawierać pasujące sloty (test po granicach)?"""
+        if _unit_resolution(node.unit_key()) is None:
+            return self._days_may_match(*node._date_range())
+        return self._slot_matches(node, whole=False)
+
+    def matches(self, node) -> bool:
+        """Czy sam węzeł `node` spełnia filtr?"""
+        if _unit_resolution(node.unit_key()) is None:
+            return self._days_may_match(*node._date_range())
+        return self._slot_matches(node, whole=True)
@@ -3,8 +3,12 @@ from datetime import datetime, timedelta, date, time
 from calendar import monthrange
 from abc import ABC, abstractmethod
 from typing import List, Iterator
-from gridtime.utils import _GRIDTIME_REGISTRY, register_unit, _all_unit_keys, _is_reachable, is_duplicated_hour, is_duplicated_quarter, is_missing_hour, is_missing_quarter
+from gridtime.utils import _GRIDTIME_REGISTRY, register_unit, _all_unit_keys, _fixed_resolution, _is_reachable, _unit_class, _unit_resolution, is_duplicated_hour, is_duplicated_quarter, is_missing_hour, is_missing_quarter
+from gridtime.slots import date_span, slot_ordinal, slot_start, slots_per_hour
+from gridtime.filters import SlotFilter
+from gridtime.cache import node_cache
 from collections.abc import Sequence
+from threading import Lock
 
 from datetime import timedelta
 
@@ -238,19 +242,75 @@ class GridtimeLeaf(ABC):
     def _iter_children(self) -> Iterator["GridtimeLeaf"]:
         return iter(())
 
+    def _date_range(self) -> tuple[date, date]:
+        """Zakres dni [start, stop) pokrywany przez jednostkę kalendarzową."""
+        raise NotImplementedError(f"Brak zakresu dat dla {self.__class__.__name__}")
+
+    def ordinal(self) -> int:
+        """Ordynał slotu (tylko jednostki o stałej rozdzielczości, patrz gridtime.slots)."""
+        minutes = _fixed_resolution(self.unit_key())
+        return slot_ordinal(self.start_time, self.is_backward, minutes)  # type: ignore
+
+    def slot_range(self, unit: str) -> range:
+        """
+        Zakres ordynałów slotów `unit` (np. "hours", "quarters15") pokrytych
+        przez tę jednostkę – liczony z granic, bez tworzenia dzieci.
+        """
+        minutes = _fixed_resolution(unit)
+
+        own = _unit_resolution(self.unit_key())
+        if own is None:
+            start, stop = self._date_range()
+            return date_span(start, stop, minutes)
+
+        if own % minutes:
+            raise ValueError(
+                f"Jednostka '{self.unit_key()}' nie dzieli się na sloty '{unit}'"
+            )
+        ratio = own // minutes
+        first = self.ordinal() * ratio
+        return range(first, first + ratio)
+
     def children_key(self) -> str | None:
         return _GRIDTIME_REGISTRY[self.__class__].get("children_key")
 
-    def _validate_unit(self, unit: str) -> None:
+    def _validate_unit(self, unit: str) -> bool:
+        """
+        Sprawdza jednostkę `unit`.  Zwraca True, gdy nie leży w gałęzi drzewa,
+        ale ma stałą rozdzielczość dzielącą ten węzeł (np. jednostki
+        z `fixed_resolution_unit`) – wtedy wyznacza ją `slot_range`.
+        """
+        by_slots = _VALID_UNITS.get((self.__class__, unit))
+        if by_slots is not None:
+            return by_slots
         if unit not in _all_unit_keys():
             raise ValueError(
                 f"Nieznana jednostka '{unit}'. Dostępne: {sorted(_all_unit_keys())}"
             )
-        if not _is_reachable(self.__class__, unit):
+        if _is_reachable(self.__class__, unit):
+            by_slots = False
+        elif self._divides_into(unit):
+            by_slots = True
+        else:
             raise ValueError(
                 f"Jednostka '{unit}' nie występuje w gałęzi drzewa z korzeniem "
                 f"{self._structure_name()} ('{self.unit_key()}')."
             )
+        # rejestr tylko rośnie, więc raz osiągalna jednostka pozostaje osiągalna
+        _VALID_UNITS[(self.__class__, unit)] = by_slots
+        return by_slots
+
+    def _divides_into(self, unit: str) -> bool:
+        minutes = _unit_resolution(unit)
+        if minutes is None:
+            return False
+        own = _unit_resolution(self.unit_key())
+        return own is None or own % minutes == 0
+
+    def _slot_units(self, unit: str) -> Iterator["GridtimeLeaf"]:
+        cls = _unit_class(unit)
+        for ordinal in self.slot_range(unit):
+            yield cls.from_ordinal(ordinal)  # type: ignore
         
     def __iter__(self) -> Iterator["GridtimeLeaf"]:
         return self._iter_children()
@@ -261,28 +321,61 @@ class GridtimeLeaf(ABC):
     def __contains__(self, other: object) -> bool:
         if not isinstance(other, GridtimeLeaf):
             return False
-        return any(node == other for node in self.walk(other.unit_key()))
+        unit = other.unit_key()
+        if _unit_resolution(unit) is not None:
+            # sloty o stałej rozdzielczości – test po ordynale, bez schodzenia w drzewo
+            self._validate_unit(unit)
+            return other.ordinal() in self.slot_range(unit)
+        return any(node == other for node in self.walk(unit))
     
+    def _identity(self) -> tuple:
+        # sloty – początek, koniec i egzemplarz duplikatu; jednostki kalendarzowe – zakres dat
+        if hasattr(self, "start_time"):
+            return (self.start_time, self.end_time, getattr(self, "is_backward", False))  # type: ignore
+        return self._date_range()
+
     def __eq__(self, other: object) -> bool:
-        return (
-            isinstance(other, self.__class__)
-            and getattr(self, "start_time", None) == getattr(other, "start_time", None)
-            and getattr(self, "end_time", None)   == getattr(other, "end_time", None)
-        )
+        return isinstance(other, self.__class__) and self._identity() == other._identity()
 
     def __hash__(self) -> int:
-        return hash((self.__class__, getattr(self, "start_time", None), getattr(self, "end_time", None)))
+        return hash((self.__class__, self._identity()))
 
     def count(self, unit: str) -> int:
+        """
+        Liczba jednostek `unit` w poddrzewie – bez tworzenia dzieci: dla
+        jednostek o stałej rozdzielczości (godziny, kwadranse …) z ordynałów,
+        dla kalendarzowych (dni, dekady, miesiące, kwartały) z granic dat.
+        """
         self._validate_unit(unit)
         if self.unit_key() == unit:
             return 1
+        if _unit_resolution(unit) is not None:
+            return len(self.slot_range(unit))
         if self.children_key() is None:
             return 0
+        counted = _calendar_count(*self._date_range(), unit)
+        if counted is not None:
+            return counted
+        return self._count_children(unit)
+
+    def _count_children(self, unit: str) -> int:
         return sum(child.count(unit) for child in self._iter_children())
 
-    def get(self, unit: str) -> List["GridtimeLeaf"]:
-        self._validate_unit(unit)
+    def duration(self) -> timedelta:
+        """Rzeczywisty czas trwania (np. 25 h dla doby jesiennej zmiany czasu)."""
+        minutes = _unit_resolution(self.unit_key())
+        if minutes is not None:
+            return timedelta(minutes=minutes)
+        return timedelta(hours=len(self.slot_range("hours")))
+
+    def duration_seconds(self) -> int:
+        return int(self.duration().total_seconds())
+
+    def get(self, unit: str, where: "SlotFilter | dict | None" = None) -> List["GridtimeLeaf"]:
+        if where is not None:
+            return list(self.walk(unit, where))
+        if self._validate_unit(unit):
+            return list(self._slot_units(unit))
         if self.unit_key() == unit:
             return [self]
         if self.children_key() is None:
@@ -292,13 +385,39 @@ class GridtimeLeaf(ABC):
             out.extend(child.get(unit))
         return out
 
-    def walk(self, unit: str) -> Iterator["GridtimeLeaf"]:
-        self._validate_unit(unit)
+    def walk(self, unit: str, where: "SlotFilter | dict | None" = None) -> Iterator["GridtimeLeaf"]:
+        """
+        Iteruje po jednostkach `unit` w poddrzewie.  `where` (SlotFilter lub
+        słownik jego argumentów) odcina gałęzie po granicach węzłów – ich
+        dzieci w ogóle nie są tworzone.
+        """
+        by_slots = self._validate_unit(unit)
+        if isinstance(where, dict):
+            where = SlotFilter(**where)
+        if by_slots:
+            if where is None:
+                yield from self._slot_units(unit)
+            elif where.may_contain(self):
+                yield from (node for node in self._slot_units(unit) if where.matches(node))
+        elif where is None:
+            yield from self._walk(unit)
+        else:
+            yield from self._walk_where(unit, where)
+
+    def _walk(self, unit: str) -> Iterator["GridtimeLeaf"]:
         if self.unit_key() == unit:
             yield self
         elif self.children_key() is not None:
             for child in self._iter_children():
-                yield from child.walk(unit)
+                yield from child._walk(unit)
+
+    def _walk_where(self, unit: str, where: SlotFilter) -> Iterator["GridtimeLeaf"]:
+        if self.unit_key() == unit:
+            if where.matches(self):
+                yield self
+        elif self.children_key() is not None and where.may_contain(self):
+            for child in self._iter_children():
+                yield from child._walk_where(unit, where)
 
     def tree(
         self,
@@ -327,7 +446,35 @@ class GridtimeLeaf(ABC):
     def print_tree(self, **kwargs): 
         print(self.tree(**kwargs))
 
+# (klasa, jednostka) już sprawdzone przez _validate_unit → czy przez slot_range
+_VALID_UNITS: dict[tuple[type, str], bool] = {}
+
+def _calendar_count(start: date, stop: date, unit: str) -> int | None:
+    """Liczba jednostek `unit` w zakresie dni [start, stop) albo None dla jednostek spoza kalendarza."""
+    if unit == "days":
+        return (stop - start).days
+    months = (stop.year - start.year) * 12 + stop.month - start.month
+    if unit == "months":
+        return months
+    if unit == "decades10":
+        return 3 * months
+    if unit == "quarters":
+        return months // 3
+    return None
+
+# Publikacja leniwie tworzonych dzieci – patrz GridtimeStructure._iter_children.
+_CHILDREN_LOCK = Lock()
+
 class GridtimeStructure(GridtimeLeaf):
+    """
+    Węzeł z leniwie tworzonymi dziećmi.
+
+    Materializacja jest bezpieczna wątkowo (także w CPython bez GIL):
+    lista dzieci jest budowana poza blokadą, a publikowana pod krótką,
+    globalną blokadą tylko wtedy, gdy żaden inny wątek jej jeszcze nie
+    opublikował.  Każdy wątek widzi więc te same instancje dzieci, a po
+    pierwszym dostępie odczyt nie bierze żadnej blokady.
+    """
     def __init__(self):
         self._children: Sequence[GridtimeLeaf] | None = None
 
@@ -336,11 +483,16 @@ class GridtimeStructure(GridtimeLeaf):
         ...
 
     def _iter_children(self) -> Iterator[GridtimeLeaf]:
-        if self._children is None:
-            self._children = self._create_children()
-        return iter(self._children)
+        children = self._children
+        if children is None:
+            created = self._create_children()
+            with _CHILDREN_LOCK:
+                if self._children is None:
+                    self._children = created
+                children = self._children
+        return iter(children)
     
-@register_unit("quarters15", step=quarter_hour_step)
+@register_unit("quarters15", step=quarter_hour_step, resolution=15)
 class QuarterHour(GridtimeLeaf):
     def __init__(self, start_time: datetime, *, is_backward: bool = False):
         super().__init__()
@@ -359,6 +511,11 @@ class QuarterHour(GridtimeLeaf):
                 f"Kwadrans {self.start_time:%Y-%m-%d %H:%M} nie jest duplikowany, "
                 f"nie można utworzyć 'cofniętej' instancji (is_backward=True)."
             )
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> "QuarterHour":
+        start, is_backward = slot_start(ordinal, 15)
+        return cls(start, is_backward=is_backward)
         
     def __repr__(self):
         base = f"{self.start_time:%Y-%m-%d %H:%M}-{self.end_time:%H:%M}"
@@ -367,7 +524,7 @@ class QuarterHour(GridtimeLeaf):
             return f"{base} [{tag}]"
         return base
 
-@register_unit("hours", children_key="quarters15", step=hour_step)
+@register_unit("hours", children_key="quarters15", step=hour_step, resolution=60)
 class Hour(GridtimeStructure):
     def __init__(self, reference_time: datetime, *, is_backward: bool = False):
         super().__init__()
@@ -386,11 +543,14 @@ class Hour(GridtimeStructure):
                 f"nie jest duplikowana, nie można utworzyć 'cofniętej' instancji "
                 f"(is_backward=True)."
             )
-        
-        self._children = self._create_children()
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> "Hour":
+        start, is_backward = slot_start(ordinal, 60)
+        return cls(start + timedelta(hours=1), is_backward=is_backward)
         
     def _create_children(self) -> list[GridtimeLeaf]:
-        return create_quarter_hours(self.start_time) # type: ignore
+        return create_quarter_hours(self.start_time, is_backward=self.is_backward) # type: ignore
     
     def strftime(self, format: str) -> str:
         return self.start_time.strftime(format)
@@ -407,11 +567,20 @@ class Day(GridtimeStructure):
     def __init__(self, day_date: date):
         super().__init__()
         self.date = day_date
-        self._children = self._create_children()
-        self.hours = self._create_children()
+
+    @classmethod
+    def containing(cls, day: date) -> "Day":
+        return cls(day)
+
+    @property
+    def hours(self) -> list["Hour"]:
+        return list(self._iter_children())  # type: ignore
 
     def _create_children(self) -> list[GridtimeLeaf]:
         return create_hours(self.date) # type: ignore
+
+    def _date_range(self) -> tuple[date, date]:
+        return self.date, self.date + timedelta(days=1)
     
     def strftime(self, format: str) -> str:
         return self.date.strftime(format)
@@ -425,10 +594,16 @@ class Month(GridtimeStructure):
         super().__init__()
         self.year = year
         self.month = month
-        self._children = self._create_children()
+
+    @classmethod
+    def containing(cls, day: date) -> "Month":
+        return cls(day.year, day.month)
 
     def _create_children(self) -> list[GridtimeLeaf]:
-        return create_days(self.year, self.month) # type: ignore
+        return create_month_decades(self.year, self.month) # type: ignore
+
+    def _date_range(self) -> tuple[date, date]:
+        return date(self.year, self.month, 1), _first_day_after_month(self.year, self.month)
     
     def __repr__(self):
         return f"{self.year}-{self.month:02}"
@@ -441,10 +616,17 @@ class Quarter(GridtimeStructure):
             raise ValueError("Kwartał musi być liczbą 1–4")
         self.year = year
         self.quarter = quarter
-        self._children = self._create_children()
+
+    @classmethod
+    def containing(cls, day: date) -> "Quarter":
+        return cls(day.year, (day.month - 1) // 3 + 1)
 
     def _create_children(self) -> list[GridtimeLeaf]:
         return create_quarter_months(self.year, self.quarter) # type: ignore
+
+    def _date_range(self) -> tuple[date, date]:
+        last_month = self.quarter * 3
+        return date(self.year, last_month - 2, 1), _first_day_after_month(self.year, last_month)
     
     def __repr__(self):
         return f"{self.year}-Q{self.quarter}"
@@ -454,10 +636,16 @@ class Year(GridtimeStructure):
     def __init__(self, year: int):
         super().__init__()
         self.year = year
-        self._children = self._create_children()
+
+    @classmethod
+    def containing(cls, day: date) -> "Year":
+        return cls(day.year)
 
     def _create_children(self) -> list[GridtimeLeaf]:
         return create_quarters(self.year, quarters=range(1, 5))  #type: ignore
+
+    def _date_range(self) -> tuple[date, date]:
+        return date(self.year, 1, 1), date(self.year + 1, 1, 1)
     
     def __repr__(self):
         return f"{self.year}"    
@@ -468,11 +656,19 @@ class Week(GridtimeStructure):
         super().__init__()
         self.iso_year = iso_year
         self.iso_week = iso_week
-        self._children = self._create_children()
+
+    @classmethod
+    def containing(cls, day: date) -> "Week":
+        iso_year, iso_week, _ = day.isocalendar()
+        return cls(iso_year, iso_week)
 
     def _create_children(self) -> list[GridtimeLeaf]:
         return create_week_days(self.iso_year, self.iso_week)  #type: ignore
 
+    def _date_range(self) -> tuple[date, date]:
+        monday = date.fromisocalendar(self.iso_year, self.iso_week, 1)
+        return monday, monday + timedelta(weeks=1)
+
     def __repr__(self):
         return f"W-{self.iso_week}-{self.iso_year}"
     
@@ -485,10 +681,20 @@ class Season(GridtimeStructure):
 
         self.year = year
         self.type = type_
-        self._children = self._create_children()
+
+    @classmethod
+    def containing(cls, day: date) -> "Season":
+        if 4 <= day.month <= 9:
+            return cls(day.year, "S")
+        return cls(day.year if day.month >= 10 else day.year - 1, "W")
 
     def _create_children(self) -> list[GridtimeLeaf]:
         return create_season_quarters(self.year, self.type) #type: ignore
+
+    def _date_range(self) -> tuple[date, date]:
+        if self.type == "S":
+            return date(self.year, 4, 1), date(self.year, 10, 1)
+        return date(self.year, 10, 1), date(self.year + 1, 4, 1)
     
     def __repr__(self):
         display_year = f"{self.year}/{self.year + 1}" if self.type == "W" else str(self.year)
@@ -507,23 +713,137 @@ class MonthDecade(GridtimeStructure):
         self.year   = year
         self.month  = month
         self.index  = index
-        self._children = self._create_children()
-        self.start_date: date = self._children[0].date  # type: ignore
-        self.end_date: date = self._children[-1].date  # type: ignore
+        days = _decade_day_range(year, month, index)
+        self.start_date: date = date(year, month, days[0])
+        self.end_date: date = date(year, month, days[-1])
+
+    @classmethod
+    def containing(cls, day: date) -> "MonthDecade":
+        return cls(day.year, day.month, min((day.day - 1) // 10 + 1, 3))
 
     def _create_children(self) -> list[GridtimeLeaf]:
         return create_decade_days(self.year, self.month, self.index)  # type: ignore
+
+    def _date_range(self) -> tuple[date, date]:
+        return self.start_date, self.end_date + timedelta(days=1)
     
     def __repr__(self) -> str:
         return f"{self.year}-{self.month:02} D{self.index} ({self.start_date.day:02}-{self.end_date.day:02})"
 
 
+def slot_unit_step(obj: "SlotUnit", steps: int) -> "SlotUnit":
+    """Przesunięcie jednostki o stałej rozdzielczości – arytmetyka na ordynałach, O(1)."""
+    if steps == 0:
+        return obj
+    return obj.from_ordinal(obj.ordinal() + steps)
+
+class SlotUnit(GridtimeStructure):
+    """
+    Baza jednostek tworzonych przez `fixed_resolution_unit` – slot o długości
+    `_minutes` identyfikowany ordynałem (patrz gridtime.slots).
+    """
+    _minutes: int = 60
+
+    def __init__(self, start_time: datetime, *, is_backward: bool = False):
+        super().__init__()
+        # slot_ordinal odrzuca sloty brakujące, niewyrównane i błędne is_backward
+        self._ordinal = slot_ordinal(start_time, is_backward, self._minutes)
+        self.start_time = start_time
+        self.end_time = start_time + timedelta(minutes=self._minutes)
+        self.is_duplicated: bool = is_duplicated_hour(start_time)
+        self.is_backward: bool = is_backward
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> "SlotUnit":
+        start, is_backward = slot_start(ordinal, cls._minutes)
+        return cls(start, is_backward=is_backward)
+
+    @classmethod
+    def slots(cls, node: GridtimeLeaf) -> list["SlotUnit"]:
+        """Wszystkie sloty tej jednostki w obrębie `node` (Day, Month, Year …)."""
+        unit = _GRIDTIME_REGISTRY[cls]["unit_key"]
+        return [cls.from_ordinal(o) for o in node.slot_range(unit)]
+
+    def ordinal(self) -> int:
+        return self._ordinal
+
+    def _create_children(self) -> list[GridtimeLeaf]:
+        child_key = self.children_key()
+        if child_key is None:
+            return []
+        child_cls = _unit_class(child_key)
+        return [child_cls.from_ordinal(o) for o in self.slot_range(child_key)]  # type: ignore
+
+    def __repr__(self):
+        base = f"{self.start_time:%Y-%m-%d %H:%M}-{self.end_time:%H:%M}"
+        if self.is_duplicated:
+            tag = "↓2nd" if self.is_backward else "↑1st"
+            return f"{base} [{tag}]"
+        return base
+
+_FIXED_UNITS: dict[str, type] = {}
+_FIXED_UNITS_LOCK = Lock()
+
+def fixed_resolution_unit(
+    minutes: int,
+    unit_key: str | None = None,
+    *,
+    children_key: str | None = None,
+    name: str | None = None,
+) -> type:
+    """
+    Tworzy (i rejestruje przez `register_unit`) klasę jednostki o długości
+    `minutes` – dowolnego dzielnika godziny, np. 5 lub 30 minut.
+
+        Minutes5 = fixed_resolution_unit(5)            # klucz "minutes5"
+        HalfHour = fixed_resolution_unit(30, "halfhours30", children_key="minutes5")
+
+    Klasa dostaje krok O(1) po ordynałach, liczbę slotów zgodną z DST
+    (`node.slot_range(klucz)`), leniwe dzieci i `Klasa.slots(node)`.
+    Ponowne wywołanie z tym samym kluczem zwraca tę samą klasę.
+    """
+    slots_per_hour(minutes)
+    unit_key = unit_key or f"minutes{minutes}"
+
+    with _FIXED_UNITS_LOCK:
+        return _fixed_resolution_unit(minutes, unit_key, children_key, name)
+
+def _fixed_resolution_unit(minutes: int, unit_key: str, children_key: str | None, name: str | None) -> type:
+    existing = _FIXED_UNITS.get(unit_key)
+    if existing is not None:
+        if existing._minutes != minutes or _GRIDTIME_REGISTRY[existing]["children_key"] != children_key:
+            raise ValueError(f"Jednostka '{unit_key}' jest już zarejestrowana z innymi parametrami")
+        return existing
+    if unit_key in _all_unit_keys():
+        raise ValueError(f"Jednostka '{unit_key}' jest już zarejestrowana")
+
+    if children_key is not None:
+        child_minutes = _unit_resolution(children_key)
+        if child_minutes is None or minutes % child_minutes:
+            raise ValueError(f"Jednostka '{unit_key}' nie dzieli się na sloty '{children_key}'")
+
+    cls = type(name or f"Minutes{minutes}", (SlotUnit,), {"_minutes": minutes})
+    register_unit(unit_key, children_key=children_key, step=slot_unit_step, resolution=minutes)(cls)
+    _FIXED_UNITS[unit_key] = cls
+    return cls
+
+def _cached_day(day_date: date) -> "Day":
+    return node_cache.get_or_create(("days", day_date), lambda: Day(day_date))
+
+def _cached_hour(end_time: datetime, is_backward: bool = False) -> "Hour":
+    return node_cache.get_or_create(
+        ("hours", end_time, is_backward), lambda: Hour(end_time, is_backward=is_backward)
+    )
+
+def _first_day_after_month(year: int, month: int) -> date:
+    return date(year, month, monthrange(year, month)[1]) + timedelta(days=1)
+
 def create_days(year: int, month: int, day_range=None) -> list[Day]:
     num_days = monthrange(year, month)[1]
     if day_range is None:
         day_range = range(1, num_days + 1)
 
-    return [Day(date(year, month, d)) for d in day_range]
+    return [_cached_day(date(year, month, d)) for d in day_range]
 
 def create_months(year: int, months: list[int]) -> list[Month]:
     return [Month(year, m) for m in months]
@@ -543,7 +863,7 @@ def create_season_quarters(year: int, type_: str) -> list[Quarter]:
         return [Quarter(year, 2), Quarter(year, 3)]
 
 def create_week_days(iso_year: int, iso_week: int) -> list[Day]:
-    return [Day(date.fromisocalendar(iso_year, iso_week, i)) for i in range(1, 8)]
+    return [_cached_day(date.fromisocalendar(iso_year, iso_week, i)) for i in range(1, 8)]
 
 def create_hours(date_: date, hour_range=range(1, 25)) -> list[Hour]:
     hours: list[Hour] = []
@@ -558,10 +878,10 @@ def create_hours(date_: date, hour_range=range(1, 25)) -> list[Hour]:
 
         # podwójna godzina przy cofnięciu czasu
         if is_duplicated_hour(start_time):
-            hours.append(Hour(dt_end, is_backward=False))  # 1. przed cofnięciem
-            hours.append(Hour(dt_end, is_backward=True))   # 2. po cofnięciu
+            hours.append(_cached_hour(dt_end, is_backward=False))  # 1. przed cofnięciem
+            hours.append(_cached_hour(dt_end, is_backward=True))   # 2. po cofnięciu
         else:
-            hours.append(Hour(dt_end))
+            hours.append(_cached_hour(dt_end))
 
     return hours
 
@@ -569,7 +889,12 @@ def create_quarter_months(year: int, quarter: int) -> list[Month]:
     start_month = 1 + (quarter - 1) * 3
     return create_months(year, list(range(start_month, start_month + 3)))
 
-def create_quarter_hours(start_time: datetime) -> list[QuarterHour]:
+def create_quarter_hours(start_time: datetime, *, is_backward: bool = False) -> list[QuarterHour]:
+    """
+    Kwadranse godziny rozpoczynającej się o `start_time`.  Dla zduplikowanej
+    godziny `is_backward` wybiera egzemplarz (↑1st / ↓2nd) – każda z dwóch
+    godzin dostaje wyłącznie własne cztery kwadranse.
+    """
     quarters: list[QuarterHour] = []
 
     for i in range(4):
@@ -579,15 +904,13 @@ def create_quarter_hours(start_time: datetime) -> list[QuarterHour]:
             continue
 
         if is_duplicated_quarter(dt):
-            quarters.append(QuarterHour(dt, is_backward=False))
-            quarters.append(QuarterHour(dt, is_backward=True))
+            quarters.append(QuarterHour(dt, is_backward=is_backward))
         else:
             quarters.append(QuarterHour(dt))
 
     return quarters
 
-def create_decade_days(year: int, month: int, index: int) -> list["Day"]:
-    """Zwraca listę obiektów Day w danej dekadzie (1-3) danego miesiąca."""
+def _decade_day_range(year: int, month: int, index: int) -> range:
     if index not in (1, 2, 3):
         raise ValueError("index dekady musi być 1, 2 lub 3")
 
@@ -597,4 +920,12 @@ def create_decade_days(year: int, month: int, index: int) -> list["Day"]:
     else:
         end_day = monthrange(year, month)[1]            # ostatni dzień miesiąca
 
-    return [Day(date(year, month, d)) for d in range(start_day, end_day + 1)]
+    return range(start_day, end_day + 1)
+
+def create_month_decades(year: int, month: int) -> list["MonthDecade"]:
+    """Trzy dekady miesiąca – dzieci Month zgodnie z rejestrem ("decades10")."""
+    return [MonthDecade(year, month, index) for index in (1, 2, 3)]
+
+def create_decade_days(year: int, month: int, index: int) -> list["Day"]:
+    """Zwraca listę obiektów Day w danej dekadzie (1-3) danego miesiąca."""
+    return [_cached_day(date(year, month, d)) for d in _decade_day_range(year, month, index)]
@@ -0,0 +1,57 @@
+# holidays.py
+"""Polskie dni ustawowo wolne od pracy."""
+from datetime import date, timedelta
+from functools import lru_cache
+
+from gridtime.snapshot import active_snapshot
+
+def easter_sunday(year: int) -> date:
+    """Data Wielkanocy (kalendarz gregoriański, algorytm Meeusa/Jonesa/Butchera)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+@lru_cache(maxsize=None)
+def polish_holidays(year: int) -> frozenset[date]:
+    """
+    Dni wolne w danym roku:
+      • stałe: 1.01, 6.01 (od 2011), 1.05, 3.05, 15.08, 1.11, 11.11, 24.12 (od 2025), 25.12, 26.12
+      • ruchome: Wielkanoc, Poniedziałek Wielkanocny, Zielone Świątki, Boże Ciało
+    """
+    snapshot = active_snapshot()
+    if snapshot is not None and year in snapshot.years:
+        return snapshot.holidays(year)
+    return _compute_polish_holidays(year)
+
+def _compute_polish_holidays(year: int) -> frozenset[date]:
+    easter = easter_sunday(year)
+    days = {
+        date(year, 1, 1),
+        date(year, 5, 1),
+        date(year, 5, 3),
+        date(year, 8, 15),
+        date(year, 11, 1),
+        date(year, 11, 11),
+        date(year, 12, 25),
+        date(year, 12, 26),
+        easter,
+        easter + timedelta(days=1),     # Poniedziałek Wielkanocny
+        easter + timedelta(days=49),    # Zielone Świątki
+        easter + timedelta(days=60),    # Boże Ciało
+    }
+    if year >= 2011:
+        days.add(date(year, 1, 6))
+    if year >= 2025:
+        days.add(date(year, 12, 24))
+    return frozenset(days)
+
+def is_holiday(day: date) -> bool:
+    return day in polish_holidays(day.year)
@@ -0,0 +1,126 @@
+# labels.py
+"""
+Masowe etykiety slotów bez `strftime` na każdy obiekt.
+
+Dla każdej kombinacji (rozdzielczość, dialekt, reżim doby) raz budowany
+jest szablon doby – lista fragmentów po dacie.  Etykiety całego Day /
+Month / Year powstają przez sklejenie daty doby z fragmentami szablonu.
+
+Dialekty:
+  • "repr" – jak `repr(hour)`:   2025-10-26 02:00-03:00 [↓2nd]
+  • "iso"  – przedział ISO-8601 z przesunięciem:
+             2025-10-26T02:00+01:00/2025-10-26T03:00+01:00
+  • "pse"  – kod doby i numer slotu w dobie (1…23/24/25, 1…92/96/100):
+             2025-10-26;4
+"""
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Optional
+
+from gridtime.slots import (
+    day_first_ordinal, day_slot_count, dst_transition_days, is_summer_time,
+    ordinal_date, slot_start,
+)
+from gridtime.utils import _fixed_resolution
+
+DIALECTS = ("repr", "iso", "pse")
+
+def _regime(day: date) -> str:
+    spring, fall = dst_transition_days(day.year)
+    if day == spring:
+        return "spring"
+    if day == fall:
+        return "fall"
+    return "summer" if spring < day < fall else "winter"
+
+def _offset(start, is_backward: bool) -> str:
+    return "+02:00" if is_summer_time(start, is_backward) else "+01:00"
+
+# dowolna doba każdego reżimu – jej data nie trafia do szablonu
+_SAMPLE_DAYS = {
+    "winter": date(2025, 1, 15),
+    "summer": date(2025, 7, 15),
+    "spring": dst_transition_days(2025)[0],
+    "fall": dst_transition_days(2025)[1],
+}
+
+@lru_cache(maxsize=None)
+def _day_template(minutes: int, dialect: str, regime: str) -> tuple[tuple[str, ...], tuple[Optional[str], ...]]:
+    """
+    (fragmenty_przed, fragmenty_po) dla doby danego reżimu; etykieta to
+    data + przed  lub  data + przed + data_końca + po  (dialekt "iso").
+    """
+    sample = _SAMPLE_DAYS[regime]
+    first = day_first_ordinal(sample, minutes)
+    count = day_slot_count(sample, minutes)
+    before: list[str] = []
+    after: list[Optional[str]] = []
+    for index in range(count):
+        start, is_backward = slot_start(first + index, minutes)
+        end, end_backward = slot_start(first + index + 1, minutes)
+        if dialect == "pse":
+            before.append(f";{index + 1}")
+            after.append(None)
+        elif dialect == "repr":
+            label = f" {start:%H:%M}-{start + timedelta(minutes=minutes):%H:%M}"
+            if start.hour == 2 and regime == "fall":
+                label += " [↓2nd]" if is_backward else " [↑1st]"
+            before.append(label)
+            after.append(None)
+        else:
+            before.append(f"T{start:%H:%M}{_offset(start, is_backward)}/")
+            after.append(f"T{end:%H:%M}{_offset(end, end_backward)}")
+    return tuple(before), tuple(after)
+
+def iter_day_labels(node, unit: str = "hours", dialect: str = "repr"):
+    """Generator list etykiet – po jednej liście na każdą (częściową) dobę węzła."""
+    minutes = _fixed_resolution(unit)
+    if dialect not in DIALECTS:
+        raise ValueError(f"Nieznany dialekt '{dialect}'. Dostępne: {DIALECTS}")
+
+    slots = node.slot_range(unit)
+    if not slots:
+        return
+    day = ordinal_date(slots.start, minutes)
+    one_day = timedelta(days=1)
+    while True:
+        first = day_first_ordinal(day, minutes)
+        if first >= slots.stop:
+            break
+        before, after = _day_template(minutes, dialect, _regime(day))
+        lo = max(slots.start - first, 0)
+        hi = min(slots.stop - first, len(before))
+        prefix = day.isoformat()
+        if dialect == "iso":
+            next_prefix = (day + one_day).isoformat()
+            last = len(before) - 1
+            yield [
+                prefix + before[i] + (next_prefix if i == last else prefix) + after[i]  # type: ignore
+                for i in range(lo, hi)
+            ]
+        else:
+            yield [prefix + piece for piece in before[lo:hi]]
+        day += one_day
+
+def format_labels(node, unit: str = "hours", dialect: str = "repr", out=None):
+    """
+    Etykiety wszystkich slotów `unit` jednostki `node` (Day, Month, Year …).
+
+    • out=None     – zwraca nową listę,
+    • out=list     – dopisuje do podanej listy i ją zwraca,
+    • out=plik/bufor (ma `write`) – zapisuje etykiety wierszami,
+      zwraca ich liczbę.
+    """
+    if out is None or isinstance(out, list):
+        labels = [] if out is None else out
+        for block in iter_day_labels(node, unit, dialect):
+            labels.extend(block)
+        return labels
+
+    written = 0
+    for block in iter_day_labels(node, unit, dialect):
+        if block:
+            out.write("\n".join(block))
+            out.write("\n")
+            written += len(block)
+    return written
@@ -0,0 +1,62 @@
+# overlap.py
+"""
+Wagi nakładania się jednostek z niezagnieżdżonych hierarchii
+(Week ↔ Month, Week ↔ MonthDecade, Season ↔ Year …).
+
+Obie rodziny są kafelkowaniem osi czasu, więc po zamianie granic na
+zakresy ordynałów (`slot_range`) wystarcza jeden przebieg dwoma
+wskaźnikami – bez schodzenia do godzin i bez zbiorów slotów.
+"""
+from datetime import date
+from typing import Iterator
+
+from gridtime.slots import day_first_ordinal
+from gridtime.utils import _fixed_resolution, _unit_class
+
+def units_between(unit: str, start: date, stop: date) -> Iterator:
+    """Kolejne jednostki `unit` (np. "weeks", "months") pokrywające dni [start, stop)."""
+    cls = _unit_class(unit)
+    if not hasattr(cls, "containing"):
+        raise ValueError(f"Jednostka '{unit}' nie jest jednostką kalendarzową")
+    node = cls.containing(start)
+    while node._date_range()[0] < stop:
+        yield node
+        node = node.next()
+
+def overlap_weights(
+    src_unit: str,
+    dst_unit: str,
+    start: date,
+    stop: date,
+    resolution: str = "hours",
+    normalize: bool = False,
+) -> dict[tuple, float]:
+    """
+    Rzadka macierz nakładania: {(jednostka_src, jednostka_dst): waga}.
+
+    Waga to liczba slotów `resolution` (z uwzględnieniem DST) wspólnych dla
+    obu jednostek w obrębie dni [start, stop).  Przy `normalize=True` waga
+    jest ułamkiem wszystkich slotów jednostki źródłowej – np. jaka część
+    tygodnia przypada na dany miesiąc.
+    """
+    minutes = _fixed_resolution(resolution)
+    if stop <= start:
+        return {}
+
+    lo, hi = day_first_ordinal(start, minutes), day_first_ordinal(stop, minutes)
+
+    src = [(node, node.slot_range(resolution)) for node in units_between(src_unit, start, stop)]
+    dst = [(node, node.slot_range(resolution)) for node in units_between(dst_unit, start, stop)]
+
+    weights: dict[tuple, float] = {}
+    i = j = 0
+    while i < len(src) and j < len(dst):
+        (a, ra), (b, rb) = src[i], dst[j]
+        shared = min(ra.stop, rb.stop, hi) - max(ra.start, rb.start, lo)
+        if shared > 0:
+            weights[(a, b)] = shared / len(ra) if normalize else shared
+        if ra.stop <= rb.stop:
+            i += 1
+        else:
+            j += 1
+    return weights
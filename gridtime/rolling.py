@@ -0,0 +1,107 @@
+# rolling.py
+"""
+Okna kroczące nad danymi ułożonymi w kolejności slotów.
+
+Okno liczy sloty, nie czas zegarowy: okno kończące się w slocie i obejmuje
+sloty i-w+1 … i w kolejności ordynałów (`gridtime.slots`), więc okno
+„24 h” zawsze obejmuje 24 sloty godzinowe, także w dobie 23- i 25-godzinnej.
+  • sum / mean – suma bieżąca, O(n); dla liczb zmiennoprzecinkowych
+                 co `window` kroków liczona od nowa (`math.fsum`),
+                 więc błąd zaokrągleń nie narasta na długich seriach,
+  • min / max  – kolejka monotoniczna, O(n),
+  • funkcja    – wywoływana na każdym oknie (lista wartości).
+"""
+import math
+from collections import deque
+from typing import Callable, Optional, Sequence, Union
+
+from gridtime.utils import _fixed_resolution, _unit_resolution
+
+_NOMINAL_MINUTES = {"days": 24 * 60, "weeks": 7 * 24 * 60}
+
+def window_slots(length: int, unit: str, slot_unit: str = "quarters15") -> int:
+    """
+    Liczba slotów `slot_unit` w oknie `length` × `unit`, np.
+    window_slots(4, "hours") == 16, window_slots(7, "days") == 672.
+    Doby i tygodnie liczone są nominalnie (24 h / 168 h).
+    """
+    slot_minutes = _fixed_resolution(slot_unit)
+    unit_minutes = _NOMINAL_MINUTES.get(unit) or _unit_resolution(unit)
+    if unit_minutes is None or unit_minutes % slot_minutes:
+        raise ValueError(f"Okna w jednostce '{unit}' nie da się wyrazić w slotach '{slot_unit}'")
+    return length * (unit_minutes // slot_minutes)
+
+def _rolling_sum(values: Sequence, window: int) -> list:
+    out, total = [], 0
+    for i, value in enumerate(values):
+        total += value
+        if i >= window:
+            total -= values[i - window]
+        if isinstance(total, float) and i % window == window - 1:
+            total = math.fsum(values[i - window + 1:i + 1])
+        out.append(total)
+    return out
+
+def _rolling_extreme(values: Sequence, window: int, better: Callable) -> list:
+    out: list = []
+    candidates: deque = deque()              # indeksy o monotonicznych wartościach
+    for i, value in enumerate(values):
+        while candidates and not better(values[candidates[-1]], value):
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        out.append(values[candidates[0]])
+    return out
+
+def _rolling_apply(values: Sequence, window: int, func: Callable) -> list:
+    out: list = []
+    current: deque = deque(maxlen=window)
+    for value in values:
+        current.append(value)
+        out.append(func(list(current)))
+    return out
+
+def rolling(
+    values: Sequence,
+    window: int,
+    how: Union[str, Callable] = "sum",
+    *,
+    min_periods: Optional[int] = None,
+    over=None,
+    unit: Optional[str] = None,
+) -> list:
+    """
+    Wartości okna kroczącego o długości `window` slotów dla każdego slotu.
+
+    • `how`         – "sum", "mean", "min", "max" albo funkcja listy wartości,
+    • `min_periods` – minimalna liczba slotów w oknie (domyślnie `window`);
+                      dla krótszych okien wynik to None,
+    • `over`/`unit` – opcjonalnie jednostka i klucz slotów, względem których
+                      sprawdzana jest długość `values`.
+    """
+    if window < 1:
+        raise ValueError("Okno musi obejmować co najmniej jeden slot")
+    if over is not None:
+        expected = len(over.slot_range(unit or "quarters15"))
+        if len(values) != expected:
+            raise ValueError(f"Oczekiwano {expected} wartości dla {over!r}, otrzymano {len(values)}")
+    if min_periods is None:
+        min_periods = window
+
+    if how == "sum":
+        out = _rolling_sum(values, window)
+    elif how == "mean":
+        out = [total / min(i + 1, window) for i, total in enumerate(_rolling_sum(values, window))]
+    elif how == "min":
+        out = _rolling_extreme(values, window, lambda kept, new: kept < new)
+    elif how == "max":
+        out = _rolling_extreme(values, window, lambda kept, new: kept > new)
+    elif callable(how):
+        out = _rolling_apply(values, window, how)
+    else:
+        raise ValueError(f"Nieznana agregacja '{how}'. Dostępne: sum, mean, min, max lub funkcja")
+
+    for i in range(min(min_periods - 1, len(out))):
+        out[i] = None
+    return out
@@ -0,0 +1,147 @@
+# slots.py
+"""
+Ordynały slotów o stałej rozdzielczości (godziny, kwadranse, …).
+
+Ordynał to numer slotu liczony chronologicznie od EPOCH (1970-01-01 00:00):
+  • brakująca godzina wiosną nie zajmuje numeru,
+  • zduplikowana godzina jesienią zajmuje dwa kolejne numery (↑1st, ↓2nd).
+
+Dla rozdzielczości `minutes` (dzielnik 60) ordynał slotu to
+    ordynał_godziny * (60 // minutes) + numer slotu w godzinie,
+więc np. cztery kwadranse godziny h mają ordynały 4h … 4h+3.
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from calendar import monthrange
+from functools import lru_cache
+
+from gridtime.snapshot import active_snapshot
+
+EPOCH = date(1970, 1, 1)
+DST_HOUR = 2          # 02:00–03:00 – godzina brakująca (marzec) / podwójna (październik)
+
+def _last_sunday(year: int, month: int) -> date:
+    last = date(year, month, monthrange(year, month)[1])
+    return last - timedelta(days=(last.weekday() - 6) % 7)
+
+def _compute_transition_days(year: int) -> tuple[date, date]:
+    return _last_sunday(year, 3), _last_sunday(year, 10)
+
+@lru_cache(maxsize=None)
+def dst_transition_days(year: int) -> tuple[date, date]:
+    """Zwraca (dzień zmiany czasu na letni, dzień zmiany czasu na zimowy)."""
+    snapshot = active_snapshot()
+    if snapshot is not None and year in snapshot.years:
+        return snapshot.dst_transition_days(year)
+    return _compute_transition_days(year)
+
+def slots_per_hour(minutes: int) -> int:
+    """Liczba slotów o długości `minutes` w jednej godzinie."""
+    if minutes <= 0 or 60 % minutes:
+        raise ValueError(f"Rozdzielczość {minutes} min nie jest dzielnikiem godziny")
+    return 60 // minutes
+
+def day_hour_count(day: date) -> int:
+    """23, 24 lub 25 – liczba godzin w dobie."""
+    spring, fall = dst_transition_days(day.year)
+    if day == spring:
+        return 23
+    if day == fall:
+        return 25
+    return 24
+
+def day_slot_count(day: date, minutes: int = 60) -> int:
+    """Liczba slotów `minutes`-minutowych w dobie (np. 92 / 96 / 100 kwadransów)."""
+    return day_hour_count(day) * slots_per_hour(minutes)
+
+def _day_first_hour(day: date) -> int:
+    spring, fall = dst_transition_days(day.year)
+    hour = (day - EPOCH).days * 24
+    if day > spring:
+        hour -= 1
+    if day > fall:
+        hour += 1
+    return hour
+
+def day_first_ordinal(day: date, minutes: int = 60) -> int:
+    """Ordynał pierwszego slotu doby."""
+    return _day_first_hour(day) * slots_per_hour(minutes)
+
+def date_span(start: date, stop: date, minutes: int = 60) -> range:
+    """Ordynały slotów dni z przedziału [start, stop)."""
+    return range(day_first_ordinal(start, minutes), day_first_ordinal(stop, minutes))
+
+def is_summer_time(start: datetime, is_backward: bool = False) -> bool:
+    """Czy slot rozpoczynający się o `start` przypada w czasie letnim (CEST)?"""
+    spring, fall = dst_transition_days(start.year)
+    day = start.date()
+    if day == spring:
+        return start.hour > DST_HOUR
+    if day == fall:
+        return start.hour < DST_HOUR or (start.hour == DST_HOUR and not is_backward)
+    return spring < day < fall
+
+def slot_ordinal(start: datetime, is_backward: bool = False, minutes: int = 60) -> int:
+    """
+    Ordynał slotu `minutes`-minutowego rozpoczynającego się o `start`.
+
+    • `is_backward=True` wskazuje drugi egzemplarz (↓2nd) zduplikowanego slotu
+    • start w brakującej godzinie ➜ ValueError
+    """
+    per_hour = slots_per_hour(minutes)
+    if start.minute % minutes or start.second or start.microsecond:
+        raise ValueError(f"{start:%Y-%m-%d %H:%M} nie jest początkiem slotu {minutes} min")
+
+    day = start.date()
+    spring, fall = dst_transition_days(day.year)
+    hour = start.hour
+    if day == spring and hour >= DST_HOUR:
+        if hour == DST_HOUR:
+            raise ValueError(f"Slot {start:%Y-%m-%d %H:%M} nie istnieje (zmiana czasu)")
+        hour -= 1
+    elif day == fall and (hour > DST_HOUR or (hour == DST_HOUR and is_backward)):
+        hour += 1
+    elif is_backward:
+        raise ValueError(f"Slot {start:%Y-%m-%d %H:%M} nie jest duplikowany (is_backward=True)")
+
+    return (_day_first_hour(day) + hour) * per_hour + start.minute // minutes
+
+def ordinal_date(ordinal: int, minutes: int = 60) -> date:
+    """Doba, do której należy slot o danym ordynale."""
+    hour = ordinal // slots_per_hour(minutes)
+    day = EPOCH + timedelta(days=hour // 24)
+    while _day_first_hour(day) > hour:
+        day -= timedelta(days=1)
+    while _day_first_hour(day) + day_hour_count(day) <= hour:
+        day += timedelta(days=1)
+    return day
+
+def slot_start(ordinal: int, minutes: int = 60) -> tuple[datetime, bool]:
+    """Odwrotność `slot_ordinal`: zwraca (start slotu, is_backward)."""
+    day = ordinal_date(ordinal, minutes)
+    hour_ord, sub = divmod(ordinal, slots_per_hour(minutes))
+    hour = hour_ord - _day_first_hour(day)
+
+    spring, fall = dst_transition_days(day.year)
+    is_backward = False
+    if day == spring and hour >= DST_HOUR:
+        hour += 1
+    elif day == fall and hour > DST_HOUR:
+        if hour == DST_HOUR + 1:
+            is_backward = True
+        hour -= 1
+
+    return datetime.combine(day, time(hour)) + timedelta(minutes=sub * minutes), is_backward
+
+def utc_to_local(utc: datetime) -> tuple[datetime, bool]:
+    """
+    Zamienia chwilę UTC (naiwną lub ze strefą) na (czas lokalny, is_backward).
+    Czas letni obowiązuje od 01:00 UTC ostatniej niedzieli marca do 01:00 UTC
+    ostatniej niedzieli października.
+    """
+    if utc.tzinfo is not None:
+        utc = utc.astimezone(timezone.utc).replace(tzinfo=None)
+    spring, fall = dst_transition_days(utc.year)
+    if datetime.combine(spring, time(1)) <= utc < datetime.combine(fall, time(1)):
+        return utc + timedelta(hours=2), False
+    local = utc + timedelta(hours=1)
+    return local, local.date() == fall and local.hour == DST_HOUR
@@ -0,0 +1,172 @@
+# slotset.py
+"""
+Zbiory slotów zapisane jako posortowane, rozłączne przebiegi ordynałów.
+
+SlotSet("quarters15") przechowuje przedziały [start, stop) ordynałów
+(`gridtime.slots`), więc cały rok kwadransów to jeden przebieg.  Suma,
+przecięcie i różnica działają w O(liczba przebiegów), przynależność
+w O(log przebiegów).
+"""
+from bisect import bisect_right
+from typing import Iterable, Iterator
+
+from gridtime.utils import _fixed_resolution, _unit_class
+
+Run = tuple[int, int]
+
+def _normalize(runs: Iterable[Run]) -> tuple[Run, ...]:
+    out: list[list[int]] = []
+    for start, stop in sorted(runs):
+        if start >= stop:
+            continue
+        if out and start <= out[-1][1]:
+            out[-1][1] = max(out[-1][1], stop)
+        else:
+            out.append([start, stop])
+    return tuple((start, stop) for start, stop in out)
+
+class SlotSet:
+    """
+    Niezmienny zbiór slotów jednostki `unit` (np. "hours", "quarters15").
+
+        dostępność = SlotSet.from_unit(Month(2025, 10)) - SlotSet.from_unit(Day(date(2025, 10, 26)))
+    """
+    __slots__ = ("unit", "_runs")
+
+    def __init__(self, unit: str = "quarters15", runs: Iterable[Run] = ()):
+        _fixed_resolution(unit)
+        self.unit = unit
+        self._runs = _normalize(runs)
+
+    # ── konstruktory ───────────────────────────────────────────────────────
+    @classmethod
+    def from_unit(cls, node, unit: str = "quarters15") -> "SlotSet":
+        """Wszystkie sloty `unit` jednostki `node` (Day, Week, Month, Season …) – bez tworzenia liści."""
+        slots = node.slot_range(unit)
+        return cls(unit, [(slots.start, slots.stop)])
+
+    @classmethod
+    def from_units(cls, nodes: Iterable, unit: str = "quarters15") -> "SlotSet":
+        runs = []
+        for node in nodes:
+            slots = node.slot_range(unit)
+            runs.append((slots.start, slots.stop))
+        return cls(unit, runs)
+
+    @classmethod
+    def from_ordinals(cls, ordinals: Iterable[int], unit: str = "quarters15") -> "SlotSet":
+        return cls(unit, ((o, o + 1) for o in ordinals))
+
+    # ── dostęp ─────────────────────────────────────────────────────────────
+    @property
+    def runs(self) -> tuple[Run, ...]:
+        return self._runs
+
+    def ordinals(self) -> Iterator[int]:
+        for start, stop in self._runs:
+            yield from range(start, stop)
+
+    def __iter__(self) -> Iterator:
+        cls = _unit_class(self.unit)
+        for ordinal in self.ordinals():
+            yield cls.from_ordinal(ordinal)
+
+    def __len__(self) -> int:
+        return sum(stop - start for start, stop in self._runs)
+
+    def __bool__(self) -> bool:
+        return bool(self._runs)
+
+    def __contains__(self, item) -> bool:
+        if not isinstance(item, int):
+            if item.unit_key() != self.unit:
+                return False
+            item = item.ordinal()
+        idx = bisect_right(self._runs, (item, float("inf"))) - 1
+        return idx >= 0 and self._runs[idx][0] <= item < self._runs[idx][1]
+
+    def covers(self, node) -> bool:
+        """Czy zbiór zawiera wszystkie sloty jednostki `node`?"""
+        slots = node.slot_range(self.unit)
+        if not slots:
+            return True
+        idx = bisect_right(self._runs, (slots.start, float("inf"))) - 1
+        return idx >= 0 and self._runs[idx][0] <= slots.start and slots.stop <= self._runs[idx][1]
+
+    # ── algebra ────────────────────────────────────────────────────────────
+    def _check(self, other: "SlotSet") -> None:
+        if not isinstance(other, SlotSet):
+            raise TypeError("Operacja wymaga drugiego SlotSet")
+        if other.unit != self.unit:
+            raise ValueError(f"Różne jednostki zbiorów: '{self.unit}' i '{other.unit}'")
+
+    def _new(self, runs: Iterable[Run]) -> "SlotSet":
+        result = SlotSet.__new__(SlotSet)
+        result.unit = self.unit
+        result._runs = tuple(runs)
+        return result
+
+    def union(self, other: "SlotSet") -> "SlotSet":
+        self._check(other)
+        a, b = self._runs, other._runs
+        merged: list[list[int]] = []
+        i = j = 0
+        while i < len(a) or j < len(b):
+            if j >= len(b) or (i < len(a) and a[i] < b[j]):
+                start, stop = a[i]
+                i += 1
+            else:
+                start, stop = b[j]
+                j += 1
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], stop)
+            else:
+                merged.append([start, stop])
+        return self._new((start, stop) for start, stop in merged)
+
+    def intersection(self, other: "SlotSet") -> "SlotSet":
+        self._check(other)
+        a, b = self._runs, other._runs
+        out: list[Run] = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            stop = min(a[i][1], b[j][1])
+            if start < stop:
+                out.append((start, stop))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return self._new(out)
+
+    def difference(self, other: "SlotSet") -> "SlotSet":
+        self._check(other)
+        b = other._runs
+        out: list[Run] = []
+        j = 0
+        for start, stop in self._runs:
+            while j < len(b) and b[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(b) and b[k][0] < stop:
+                if b[k][0] > start:
+                    out.append((start, b[k][0]))
+                start = max(start, b[k][1])
+                k += 1
+            if start < stop:
+                out.append((start, stop))
+        return self._new(out)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SlotSet) and self.unit == other.unit and self._runs == other._runs
+
+    def __hash__(self) -> int:
+        return hash((self.unit, self._runs))
+
+    def __repr__(self) -> str:
+        return f"SlotSet({self.unit!r}, runs={len(self._runs)}, slots={len(self)})"
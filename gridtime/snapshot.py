@@ -0,0 +1,200 @@
+# snapshot.py
+"""
+Prekompilowany kalendarz w pliku binarnym (mmap).
+
+`build_snapshot(ścieżka, lata, taryfy)` zapisuje raz:
+  • dni zmiany czasu każdego roku,
+  • mapę bitową świąt,
+  • maski stref skompilowanych taryf (jak `CompiledTariff.year_mask`).
+
+`use_snapshot(load_snapshot(ścieżka))` – albo zmienna środowiskowa
+GRIDTIME_SNAPSHOT przy imporcie pakietu – sprawia, że `dst_transition_days`,
+`polish_holidays` i `CompiledTariff` czytają dane z pliku zamiast je liczyć.
+Maski są zwracane jako `memoryview` na zmapowany plik (bez kopiowania).
+
+Dni zmiany czasu i święta trafiają do pamięci podręcznych (lru_cache)
+przy pierwszym odczycie roku – z mapowania korzystają w praktyce maski taryf.
+Po `use_snapshot(None)` skompilowane taryfy porzucają widoki na plik,
+więc `close()` zwalnia mapowanie.
+
+Układ pliku (little-endian):
+    nagłówek   <6sHHHH   magic, wersja, pierwszy rok, liczba lat, liczba taryf
+    lata       <HH46s    dzień roku zmiany na letni / zimowy,
+                         mapa świąt (bit = dzień roku - 1)
+    taryfy     <20s32sHH odcisk definicji, nazwa, minuty, długość nazw stref,
+               nazwy stref (oddzielone \\x1f), następnie <QI na rok
+               (przesunięcie i długość maski)
+    maski      bajty kodów stref
+"""
+import hashlib
+import mmap
+import struct
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+MAGIC = b"GTSNAP"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<6sHHHH")
+_YEAR = struct.Struct("<HH46s")
+_TARIFF = struct.Struct("<20s32sHH")
+_MASK = struct.Struct("<QI")
+
+_ACTIVE: Optional["Snapshot"] = None
+
+def tariff_fingerprint(tariff) -> bytes:
+    """Odcisk definicji taryfy – maska ze snapshotu pasuje tylko do identycznej definicji."""
+    parts = [tariff.name, tariff.default_zone, tariff.clock]
+    for rule in tariff.rules:
+        parts.append(f"{rule.zone}|{sorted(rule.hours)}|{sorted(rule.days)}|{sorted(rule.months)}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).digest()
+
+class Snapshot:
+    """Snapshot kalendarza zmapowany w pamięci (tylko do odczytu)."""
+    def __init__(self, path: str):
+        self.path = path
+        self.closed = False
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, first_year, year_count, tariff_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} nie jest snapshotem gridtime")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Nieobsługiwana wersja snapshotu {version} (oczekiwano {FORMAT_VERSION})")
+        self.version = version
+        self.years = range(first_year, first_year + year_count)
+
+        offset = _HEADER.size
+        self._years_offset = offset
+        offset += _YEAR.size * year_count
+
+        self._tariffs: dict[tuple[bytes, int], tuple[str, tuple[str, ...], list[tuple[int, int]]]] = {}
+        for _ in range(tariff_count):
+            fingerprint, name, minutes, zones_len = _TARIFF.unpack_from(self._mmap, offset)
+            offset += _TARIFF.size
+            zones = tuple(bytes(self._view[offset:offset + zones_len]).decode("utf-8").split("\x1f"))
+            offset += zones_len
+            masks = []
+            for _ in range(year_count):
+                masks.append(_MASK.unpack_from(self._mmap, offset))
+                offset += _MASK.size
+            self._tariffs[(fingerprint, minutes)] = (name.rstrip(b"\0").decode("utf-8"), zones, masks)
+
+    def _year_record(self, year: int) -> tuple[int, int, bytes]:
+        if self.closed:
+            raise ValueError(f"Snapshot {self.path} jest zamknięty")
+        index = year - self.years.start
+        return _YEAR.unpack_from(self._mmap, self._years_offset + index * _YEAR.size)
+
+    def dst_transition_days(self, year: int) -> tuple[date, date]:
+        spring, fall, _ = self._year_record(year)
+        jan1 = date(year, 1, 1)
+        return jan1 + timedelta(days=spring - 1), jan1 + timedelta(days=fall - 1)
+
+    def holidays(self, year: int) -> frozenset[date]:
+        bitmap = self._year_record(year)[2]
+        jan1 = date(year, 1, 1)
+        return frozenset(
+            jan1 + timedelta(days=bit)
+            for bit in range(366)
+            if bitmap[bit >> 3] & (1 << (bit & 7))
+        )
+
+    def tariff_mask(self, tariff, minutes: int, year: int) -> Optional[memoryview]:
+        """Maska roczna taryfy albo None, jeśli snapshot jej nie zawiera."""
+        entry = self._tariffs.get((tariff_fingerprint(tariff), minutes))
+        if self.closed or entry is None or year not in self.years:
+            return None
+        offset, length = entry[2][year - self.years.start]
+        return self._view[offset:offset + length]
+
+    def tariff_names(self) -> list[str]:
+        return sorted({name for name, _, _ in self._tariffs.values()})
+
+    def close(self) -> None:
+        """
+        Zamyka snapshot (i wyłącza go, jeśli jest aktywny).  Gdy poza pakietem
+        żyją jeszcze widoki masek (np. wyniki `year_mask`), mapowanie zostaje
+        zwolnione dopiero razem z ostatnim z nich.
+        """
+        if self.closed:
+            return
+        if active_snapshot() is self:
+            use_snapshot(None)
+        self.closed = True
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"Snapshot({self.path!r}, years={self.years.start}-{self.years.stop - 1}, tariffs={self.tariff_names()})"
+
+def build_snapshot(path: str, years: Iterable[int], tariffs: Iterable = (), unit: str = "quarters15") -> None:
+    """
+    Kompiluje kalendarz dla kolejnych lat `years` (np. range(2015, 2036))
+    wraz z maskami podanych taryf (`Tariff`) dla jednostki `unit`.
+    """
+    # import lokalny – moduły obliczeniowe same odczytują aktywny snapshot
+    from gridtime.holidays import _compute_polish_holidays
+    from gridtime.slots import _compute_transition_days
+    from gridtime.tariffs import CompiledTariff
+
+    years = sorted(years)
+    if not years:
+        raise ValueError("Snapshot musi obejmować co najmniej jeden rok")
+    first_year, year_count = years[0], years[-1] - years[0] + 1
+    if len(years) != year_count:
+        raise ValueError("Lata snapshotu muszą tworzyć ciągły zakres")
+    tariffs = list(tariffs)
+
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, first_year, year_count, len(tariffs)))
+    for year in years:
+        spring, fall = _compute_transition_days(year)
+        bitmap = bytearray(46)
+        for holiday in _compute_polish_holidays(year):
+            bit = holiday.timetuple().tm_yday - 1
+            bitmap[bit >> 3] |= 1 << (bit & 7)
+        out += _YEAR.pack(spring.timetuple().tm_yday, fall.timetuple().tm_yday, bytes(bitmap))
+
+    # nagłówki taryf (z miejscem na przesunięcia masek) i same maski
+    masks: list[bytes] = []
+    mask_slots: list[int] = []
+    for tariff in tariffs:
+        compiled = CompiledTariff(tariff, unit)
+        zones = "\x1f".join(compiled.zones).encode("utf-8")
+        name = tariff.name.encode("utf-8")[:32]
+        out += _TARIFF.pack(tariff_fingerprint(tariff), name, compiled.minutes, len(zones))
+        out += zones
+        for year in years:
+            mask_slots.append(len(out))
+            out += _MASK.pack(0, 0)
+            masks.append(bytes(compiled._build_year(year)))
+
+    for slot, mask in zip(mask_slots, masks):
+        _MASK.pack_into(out, slot, len(out), len(mask))
+        out += mask
+
+    with open(path, "wb") as fh:
+        fh.write(out)
+
+def load_snapshot(path: str) -> Snapshot:
+    return Snapshot(path)
+
+def use_snapshot(snapshot: Optional[Snapshot]) -> None:
+    """Ustawia aktywny snapshot (None – powrót do obliczeń) i czyści zależne cache."""
+    global _ACTIVE
+    _ACTIVE = snapshot
+
+    from gridtime.holidays import polish_holidays
+    from gridtime.slots import dst_transition_days
+    from gridtime.tariffs import CompiledTariff
+    dst_transition_days.cache_clear()
+    polish_holidays.cache_clear()
+    CompiledTariff.invalidate_all()
+
+def active_snapshot() -> Optional[Snapshot]:
+    return _ACTIVE
@@ -0,0 +1,282 @@
+# tariffs.py
+"""
+Strefy czasowe taryf (G11, G12, G12w, C21, C22a, C22b …).
+
+Taryfa to lista reguł `ZoneRule` sprawdzanych po kolei – pierwsza pasująca
+wyznacza strefę, w przeciwnym razie obowiązuje `default_zone`.
+`Tariff.compile(unit)` zwraca `CompiledTariff`, który raz na rok buduje maskę
+kodów stref zgodną z ordynałami slotów (`gridtime.slots`) i odpowiada na
+pytanie „strefa slotu i” w O(1).
+"""
+import weakref
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional, Union
+
+from gridtime.holidays import is_holiday
+from gridtime.slots import (
+    DST_HOUR, day_first_ordinal, dst_transition_days, is_summer_time,
+    ordinal_date, slots_per_hour,
+)
+from gridtime.snapshot import active_snapshot
+from gridtime.utils import _fixed_resolution
+
+DAY_TYPES = ("workday", "saturday", "sunday", "holiday")
+
+def day_type(day: date) -> str:
+    """Typ dnia dla reguł taryfowych – święto ma pierwszeństwo przed dniem tygodnia."""
+    if is_holiday(day):
+        return "holiday"
+    weekday = day.weekday()
+    if weekday == 5:
+        return "saturday"
+    if weekday == 6:
+        return "sunday"
+    return "workday"
+
+class ZoneRule:
+    """
+    Reguła strefy:
+      • `hours`  – godziny doby (0–23) według zegara taryfy,
+      • `days`   – typy dni z DAY_TYPES,
+      • `months` – miesiące (1–12), w których reguła obowiązuje.
+    """
+    def __init__(
+        self,
+        zone: str,
+        hours: Iterable[int],
+        *,
+        days: Iterable[str] = DAY_TYPES,
+        months: Iterable[int] = range(1, 13),
+    ):
+        self.zone = zone
+        self.hours = frozenset(hours)
+        self.days = frozenset(days)
+        self.months = frozenset(months)
+
+        if not self.hours <= set(range(24)):
+            raise ValueError("Godziny reguły muszą być z zakresu 0–23")
+        unknown = self.days - set(DAY_TYPES)
+        if unknown:
+            raise ValueError(f"Nieznane typy dni {sorted(unknown)}. Dostępne: {DAY_TYPES}")
+        if not self.months <= set(range(1, 13)):
+            raise ValueError("Miesiące reguły muszą być z zakresu 1–12")
+
+    def matches(self, kind: str, month: int, hour: int) -> bool:
+        return hour in self.hours and kind in self.days and month in self.months
+
+    def __repr__(self) -> str:
+        return f"ZoneRule({self.zone!r}, hours={sorted(self.hours)})"
+
+class Tariff:
+    """
+    Definicja taryfy.  `clock="winter"` oznacza, że godziny reguł podano
+    w czasie zimowym (CET) – latem strefy przesuwają się o godzinę względem
+    zegara lokalnego, tak jak w wielu taryfach OSD.
+    """
+    def __init__(
+        self,
+        name: str,
+        rules: Iterable[ZoneRule] = (),
+        *,
+        default_zone: str,
+        clock: str = "local",
+    ):
+        if clock not in ("local", "winter"):
+            raise ValueError("Zegar taryfy musi być 'local' lub 'winter'")
+        self.name = name
+        self.rules = tuple(rules)
+        self.default_zone = default_zone
+        self.clock = clock
+
+    def zones(self) -> tuple[str, ...]:
+        """Nazwy stref; indeks w tej krotce to kod strefy w maskach."""
+        names = [self.default_zone]
+        for rule in self.rules:
+            if rule.zone not in names:
+                names.append(rule.zone)
+        return tuple(names)
+
+    def zone_for(self, kind: str, month: int, hour: int) -> str:
+        for rule in self.rules:
+            if rule.matches(kind, month, hour):
+                return rule.zone
+        return self.default_zone
+
+    def zone_at(self, start: datetime, is_backward: bool = False) -> str:
+        """Strefa slotu rozpoczynającego się o `start` (wyliczana wprost, bez masek)."""
+        hour = start.hour
+        if self.clock == "winter" and is_summer_time(start, is_backward):
+            hour = (hour - 1) % 24
+        return self.zone_for(day_type(start.date()), start.month, hour)
+
+    def compile(self, unit: str = "quarters15") -> "CompiledTariff":
+        return CompiledTariff(self, unit)
+
+    def __repr__(self) -> str:
+        return f"Tariff({self.name!r})"
+
+class CompiledTariff:
+    """
+    Taryfa skompilowana dla jednostki `unit` ("hours", "quarters15", …).
+    Maski roczne (`bytes`, jeden bajt = kod strefy) są budowane leniwie
+    z wzorców dobowych, współdzielonych przez dni o tym samym typie,
+    miesiącu i reżimie DST.
+    """
+    # wszystkie instancje – use_snapshot() unieważnia ich maski
+    _instances: "weakref.WeakSet[CompiledTariff]" = weakref.WeakSet()
+
+    def __init__(self, tariff: Tariff, unit: str = "quarters15"):
+        minutes = _fixed_resolution(unit)
+        self.tariff = tariff
+        self.unit = unit
+        self.minutes = minutes
+        self.zones = tariff.zones()
+        if len(self.zones) > 255:
+            raise ValueError("Taryfa może mieć co najwyżej 255 stref")
+        self._codes = {zone: code for code, zone in enumerate(self.zones)}
+        self._patterns: dict[tuple, bytes] = {}
+        self._years: dict[int, tuple[int, Union[bytes, memoryview]]] = {}
+        CompiledTariff._instances.add(self)
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Porzuca maski roczne wszystkich instancji (np. widoki na zamykany snapshot)."""
+        for compiled in list(cls._instances):
+            compiled._years.clear()
+
+    # ── budowa masek ──────────────────────────────────────────────────────
+    def _day_codes(self, day: date) -> bytes:
+        spring, fall = dst_transition_days(day.year)
+        if day == spring or day == fall:
+            regime = day
+        else:
+            regime = "summer" if spring < day < fall else "winter"
+        key = (day_type(day), day.month, regime)
+
+        pattern = self._patterns.get(key)
+        if pattern is None:
+            per_hour = slots_per_hour(self.minutes)
+            codes = bytearray()
+            for hour in range(24):
+                start = datetime.combine(day, time(hour))
+                if day == spring and hour == DST_HOUR:
+                    continue
+                copies = (False, True) if day == fall and hour == DST_HOUR else (False,)
+                for is_backward in copies:
+                    code = self._codes[self.tariff.zone_at(start, is_backward)]
+                    codes.extend(bytes((code,)) * per_hour)
+            pattern = self._patterns[key] = bytes(codes)
+        return pattern
+
+    def year_mask(self, year: int) -> Union[bytes, memoryview]:
+        """
+        Kody stref wszystkich slotów roku, indeksowane od pierwszego slotu
+        1 stycznia (z aktywnego snapshotu – `memoryview` na plik).
+        """
+        return self._year(year)[1]
+
+    def _build_year(self, year: int) -> bytes:
+        day, stop = date(year, 1, 1), date(year + 1, 1, 1)
+        parts = []
+        while day < stop:
+            parts.append(self._day_codes(day))
+            day += timedelta(days=1)
+        return b"".join(parts)
+
+    def _year(self, year: int) -> tuple[int, Union[bytes, memoryview]]:
+        cached = self._years.get(year)
+        if cached is None:
+            snapshot = active_snapshot()
+            mask = None if snapshot is None else snapshot.tariff_mask(self.tariff, self.minutes, year)
+            if mask is None:
+                mask = self._build_year(year)
+            cached = self._years[year] = (day_first_ordinal(date(year, 1, 1), self.minutes), mask)
+        return cached
+
+    # ── zapytania ──────────────────────────────────────────────────────────
+    def zone_code(self, ordinal: int) -> int:
+        first, mask = self._year(ordinal_date(ordinal, self.minutes).year)
+        return mask[ordinal - first]
+
+    def zone_of(self, slot) -> str:
+        """Strefa slotu – ordynału (int) albo jednostki `self.unit`."""
+        if not isinstance(slot, int):
+            if slot.unit_key() != self.unit:
+                raise ValueError(f"Oczekiwano jednostki '{self.unit}', otrzymano '{slot.unit_key()}'")
+            slot = slot.ordinal()
+        return self.zones[self.zone_code(slot)]
+
+    def codes(self, node, slots: Optional[range] = None) -> bytes:
+        """
+        Kody stref dla wszystkich slotów węzła (Day, Month, Season, Year …)
+        lub dla zakresu ordynałów `slots` – jednym cięciem masek rocznych.
+        """
+        if slots is None:
+            slots = node.slot_range(self.unit)
+        if not slots:
+            return b""
+        first_year = ordinal_date(slots.start, self.minutes).year
+        last_year = ordinal_date(slots.stop - 1, self.minutes).year
+        parts = []
+        for year in range(first_year, last_year + 1):
+            first, mask = self._year(year)
+            lo = max(slots.start - first, 0)
+            hi = min(slots.stop - first, len(mask))
+            parts.append(mask[lo:hi])
+        return b"".join(parts)
+
+    def zone_array(self, node) -> list[str]:
+        """Nazwy stref kolejnych slotów węzła."""
+        zones = self.zones
+        return [zones[code] for code in self.codes(node)]
+
+    def zone_counts(self, node) -> dict[str, int]:
+        """Liczba slotów w każdej strefie."""
+        codes = self.codes(node)
+        return {zone: codes.count(code) for code, zone in enumerate(self.zones)}
+
+    def __repr__(self) -> str:
+        return f"CompiledTariff({self.tariff.name!r}, unit={self.unit!r})"
+
+
+# ── przykładowe definicje ────────────────────────────────────────────────────
+# Godziny stref różnią się między OSD – poniższe odpowiadają typowym
+# tabelom taryfowym; własne warianty buduje się z ZoneRule / Tariff.
+_NIGHT_G12 = (22, 23, 0, 1, 2, 3, 4, 5, 13, 14)
+_WEEKEND = ("saturday", "sunday", "holiday")
+_SUMMER = range(4, 10)
+_WINTER = (1, 2, 3, 10, 11, 12)
+
+TARIFFS: dict[str, Tariff] = {
+    "G11": Tariff("G11", default_zone="całodobowa"),
+    "G12": Tariff(
+        "G12",
+        [ZoneRule("nocna", _NIGHT_G12)],
+        default_zone="dzienna",
+        clock="winter",
+    ),
+    "G12w": Tariff(
+        "G12w",
+        [
+            ZoneRule("nocna", range(24), days=_WEEKEND),
+            ZoneRule("nocna", _NIGHT_G12),
+        ],
+        default_zone="dzienna",
+        clock="winter",
+    ),
+    "C21": Tariff("C21", default_zone="całodobowa"),
+    "C22a": Tariff(
+        "C22a",
+        [
+            ZoneRule("pozaszczytowa", range(24), days=_WEEKEND),
+            ZoneRule("szczytowa", (7, 8, 9, 10, 11, 12, 19, 20, 21), months=_SUMMER),
+            ZoneRule("szczytowa", (7, 8, 9, 10, 11, 12, 16, 17, 18, 19, 20), months=_WINTER),
+        ],
+        default_zone="pozaszczytowa",
+    ),
+    "C22b": Tariff(
+        "C22b",
+        [ZoneRule("dzienna", range(6, 21))],
+        default_zone="nocna",
+    ),
+}
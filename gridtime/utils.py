@@ -22,12 +22,19 @@ def print_structure_tree(cls: type, indent: str = ""):
         for child_cls in child_classes:
             print_structure_tree(child_cls, indent + "  ")
 
-def register_unit(unit_key: str, children_key: Optional[str] = None, step: Optional[str] = None):
+def register_unit(unit_key: str, children_key: Optional[str] = None, step: Optional[str] = None,
+                  resolution: Optional[int] = None):
+    """
+    Rejestruje klasę jednostki.  `resolution` (w minutach) podaje się dla
+    jednostek o stałej długości slotu (godziny, kwadranse) – to one mają
+    ordynały w `gridtime.slots`.
+    """
     def decorator(cls):
         _GRIDTIME_REGISTRY[cls] = {
             "unit_key": unit_key,
             "children_key": children_key,
             "step": step,     
+            "resolution": resolution,
         }
         return cls
     return decorator
@@ -36,6 +43,31 @@ def _all_unit_keys() -> set[str]:
     """Zwraca zbiór wszystkich zarejestrowanych unit_key‑ów."""
     return {props["unit_key"] for props in _GRIDTIME_REGISTRY.values()}
 
+def _unit_resolution(unit_key: str) -> Optional[int]:
+    """Rozdzielczość (w minutach) jednostki `unit_key` lub None dla jednostek kalendarzowych."""
+    for props in _GRIDTIME_REGISTRY.values():
+        if props["unit_key"] == unit_key:
+            return props.get("resolution")
+    raise ValueError(
+        f"Nieznana jednostka '{unit_key}'. Dostępne: {sorted(_all_unit_keys())}"
+    )
+
+def _fixed_resolution(unit_key: str) -> int:
+    """Rozdzielczość (w minutach) jednostki o stałej długości slotu; ValueError dla kalendarzowych."""
+    minutes = _unit_resolution(unit_key)
+    if minutes is None:
+        raise ValueError(f"Jednostka '{unit_key}' nie ma stałej rozdzielczości")
+    return minutes
+
+def _unit_class(unit_key: str) -> type:
+    """Klasa zarejestrowana pod kluczem `unit_key`."""
+    for cls, props in _GRIDTIME_REGISTRY.items():
+        if props["unit_key"] == unit_key:
+            return cls
+    raise ValueError(
+        f"Nieznana jednostka '{unit_key}'. Dostępne: {sorted(_all_unit_keys())}"
+    )
+
 def _is_reachable(cls: type, target_unit: str) -> bool:
     """
     Czy z danej klasy istnieje ścieżka do jednostki `target_unit`
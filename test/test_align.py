@@ -0,0 +1,44 @@
+# test/test_align.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from datetime import date
+import gridtime as gt
+
+
+def test_duplicated_hour_maps_onto_own_quarters():
+    day = gt.Day(date(2025, 10, 26))
+    prices = list(range(25))                      # 2:00 ↑1st = 2, 2:00 ↓2nd = 3
+    expanded = gt.broadcast(prices, day, "hours", "quarters15")
+    assert len(expanded) == 100
+    quarters = list(day.walk("quarters15"))
+    for price, q in zip(expanded, quarters):
+        if q.is_duplicated:
+            assert price == (3 if q.is_backward else 2)
+
+
+def test_combine_hourly_prices_with_quarter_volumes():
+    day = gt.Day(date(2025, 3, 30))
+    prices = [10.0] * 23
+    volumes = [1.0] * 92
+    values = gt.combine(prices, "hours", volumes, "quarters15", day)
+    assert values == [10.0] * 92
+
+
+def test_broadcast_calendar_coefficients():
+    month = gt.Month(2025, 10)
+    coefficients = list(range(1, 32))
+    expanded = gt.broadcast(coefficients, month, "days", "hours")
+    assert len(expanded) == 745
+    assert expanded.count(26) == 25
+
+    left, right, unit = gt.align([2.0], "months", [1.0] * 745, "hours", month)
+    assert unit == "hours" and left == [2.0] * 745 and right == [1.0] * 745
+
+
+def test_broadcast_length_mismatch():
+    with pytest.raises(ValueError):
+        gt.broadcast([1, 2, 3], gt.Day(date(2025, 1, 1)), "hours", "quarters15")
@@ -0,0 +1,48 @@
+# test/test_cache.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+import gridtime as gt
+from gridtime.cache import NodeCache
+from gridtime.gridtime import MonthDecade
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    gt.node_cache.clear()
+    yield
+    gt.node_cache.clear()
+
+
+def test_week_and_month_share_day_instances():
+    month_days = gt.Month(2025, 10).get("days")
+    week_days = list(gt.Week(2025, 44))        # 27.10 – 2.11
+    assert week_days[0] is month_days[26]
+    assert list(week_days[0])[5] is list(month_days[26])[5]
+
+    decade_days = list(MonthDecade(2025, 10, 3))
+    assert decade_days[-1] is month_days[-1]
+    assert gt.node_cache.info().hits >= 5 + 5
+
+
+def test_cache_is_bounded_and_resizable():
+    cache = NodeCache(maxsize=2)
+    for key in "abc":
+        cache.get_or_create(key, object)
+    assert len(cache) == 2
+    first = cache.get_or_create("c", object)
+    assert cache.get_or_create("c", object) is first
+    assert cache.info() == (2, 3, 2, 2)
+
+    cache.resize(1)
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.info() == (0, 0, 1, 0)
+
+
+def test_zero_size_disables_sharing():
+    cache = NodeCache(maxsize=0)
+    assert cache.get_or_create("a", object) is not cache.get_or_create("a", object)
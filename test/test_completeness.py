@@ -0,0 +1,56 @@
+# test/test_completeness.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from datetime import datetime, date, timedelta, timezone
+import gridtime as gt
+
+
+def test_complete_october_day_from_utc_stream():
+    day = gt.Day(date(2025, 10, 26))
+    start = datetime(2025, 10, 25, 22, 0, tzinfo=timezone.utc)      # 00:00 CEST
+    stamps = (start + timedelta(minutes=15 * i) for i in range(100))
+    report = gt.completeness(day, stamps)
+    assert report.is_complete
+    assert len(day.slot_range("quarters15")) == 100
+
+
+def test_missing_duplicate_and_out_of_range():
+    day = gt.Day(date(2025, 3, 30))
+    quarters = list(day.walk("quarters15"))
+    assert len(quarters) == 92
+
+    records = quarters[:10] + quarters[11:] + [quarters[0], gt.QuarterHour(datetime(2025, 3, 31, 0, 0))]
+    report = gt.completeness(day, records)
+    assert report.missing == [quarters[10].ordinal()]
+    assert [repr(q) for q in report.missing_slots()] == [repr(quarters[10])]
+    assert report.duplicates == {quarters[0].ordinal(): 2}
+    assert len(report.out_of_range) == 1
+
+
+def test_naive_fold_and_invalid_timestamps():
+    checker = gt.CompletenessChecker(gt.Day(date(2025, 10, 26)), "hours")
+    checker.add(datetime(2025, 10, 26, 2, 0))
+    checker.add(datetime(2025, 10, 26, 2, 0, fold=1))
+    checker.add(datetime(2025, 10, 26, 2, 30))            # nie jest początkiem godziny
+    checker.add(None)
+    report = checker.report()
+    assert len(report.missing) == 23
+    assert not report.duplicates
+    assert report.invalid == [datetime(2025, 10, 26, 2, 30), None]
+
+
+def test_wrong_unit_is_an_error():
+    day = gt.Day(date(2025, 10, 26))
+    with pytest.raises(ValueError, match="Oczekiwano jednostki"):
+        gt.completeness(day, [gt.Hour(datetime(2025, 10, 26, 1))])
+
+
+def test_contains_uses_ordinals():
+    day = gt.Day(date(2025, 10, 26))
+    assert gt.QuarterHour(datetime(2025, 10, 26, 2, 15), is_backward=True) in day
+    assert gt.QuarterHour(datetime(2025, 10, 27, 0, 0)) not in day
+    assert gt.QuarterHour(datetime(2025, 10, 26, 2, 15), is_backward=True) not in gt.Hour(datetime(2025, 10, 26, 3))
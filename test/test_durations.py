@@ -0,0 +1,71 @@
+# test/test_durations.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gc
+import weakref
+import pytest
+from datetime import datetime, date, timedelta
+import gridtime as gt
+from gridtime.gridtime import MonthDecade
+from gridtime.utils import _is_reachable
+
+
+def test_count_uses_ordinals_without_building_children():
+    season = gt.Season(2025, "W")
+    assert season.count("quarters15") == (92 + 90) * 96
+    assert season._children is None
+    assert gt.Year(2025).count("quarters15") == 35040
+
+
+@pytest.mark.parametrize("node", [
+    gt.Year(2024), gt.Season(2024, "W"), gt.Quarter(2025, 1), gt.Month(2024, 2),
+    gt.Week(2025, 1), MonthDecade(2025, 2, 3),
+])
+def test_calendar_counts_from_bounds(node):
+    units = [u for u in ("quarters", "months", "decades10", "days") if _is_reachable(node.__class__, u)]
+    counts = {u: node.count(u) for u in units}
+    assert node._children is None                   # bez tworzenia dzieci
+    assert counts == {u: sum(1 for _ in node.walk(u)) for u in units}
+    assert counts == {u: len(node.get(u)) for u in units}
+
+
+def test_decade_counts():
+    assert gt.Year(2025).count("decades10") == 36
+    assert gt.Month(2025, 2).count("decades10") == 3
+
+
+def test_count_keeps_no_references():
+    gt.node_cache.clear()
+    year = gt.Year(2030)
+    assert year.count("days") == 365
+    ref = weakref.ref(year)
+    del year
+    gc.collect()
+    assert ref() is None
+
+
+def test_durations():
+    assert gt.Day(date(2025, 10, 26)).duration() == timedelta(hours=25)
+    assert gt.Month(2025, 3).duration_seconds() == 743 * 3600
+    assert gt.QuarterHour(datetime(2025, 1, 1, 0, 0)).duration() == timedelta(minutes=15)
+
+
+def test_consecutive_unit_counts():
+    counts = gt.slot_counts(gt.Month(2025, 1), 12, "hours")
+    assert sum(counts) == 8760
+    assert counts[2] == 743 and counts[9] == 745
+    assert gt.durations(gt.Day(date(2025, 3, 29)), 3)[1] == timedelta(hours=23)
+    assert gt.slot_counts(gt.Hour(datetime(2025, 10, 26, 3)), 3, "quarters15") == [4, 4, 4]
+    assert gt.span_count(gt.Year(2015), gt.Year(2034), "hours") == sum(
+        gt.Year(y).count("hours") for y in range(2015, 2035)
+    )
+
+
+def test_durations_of_sub_hour_units():
+    first = gt.QuarterHour(datetime(2025, 10, 26, 2, 45))
+    assert gt.durations(first, 3) == [timedelta(minutes=15)] * 3
+    Minutes5 = gt.fixed_resolution_unit(5)
+    assert gt.durations(Minutes5(datetime(2025, 3, 30, 1, 55)), 2) == [timedelta(minutes=5)] * 2
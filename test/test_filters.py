@@ -0,0 +1,53 @@
+# test/test_filters.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from datetime import datetime, date
+import gridtime as gt
+from gridtime.filters import SlotFilter
+
+
+def test_walk_where_matches_python_filter():
+    f = SlotFilter(weekdays=range(5), hours=range(7, 22), months=(1, 2, 3))
+    quarter = gt.Quarter(2025, 1)
+    expected = [q for q in gt.Quarter(2025, 1).walk("quarters15") if f.matches(q)]
+    assert quarter.get("quarters15", where=f) == expected
+    assert len(expected) == 64 * 15 * 4       # 64 dni pon.–pt. w I kw. 2025
+
+
+def test_walk_where_prunes_untouched_branches():
+    year = gt.Year(2025)
+    hours = list(year.walk("hours", where={"duplicated": True}))
+    assert [h.is_backward for h in hours] == [False, True]
+
+    built_days = [
+        d for q in year._children for m in q._children or ()
+        for dec in m._children or () for d in dec._children or ()
+        if d._children is not None
+    ]
+    assert [d.date for d in built_days] == [date(2025, 10, 26)]
+
+
+def test_walk_where_date_range_and_backward():
+    day = gt.Day(date(2025, 10, 26))
+    quarters = list(day.walk("quarters15", where=SlotFilter(backward=True)))
+    assert len(quarters) == 4
+    assert all(q.is_backward for q in quarters)
+
+    window = SlotFilter(start=datetime(2025, 10, 26, 22), stop=date(2025, 10, 27))
+    assert len(day.get("hours", where=window)) == 2
+
+
+def test_filter_validates_arguments():
+    with pytest.raises(ValueError):
+        SlotFilter(hours=[24])
+
+
+def test_walk_reaches_month_decades():
+    decades = list(gt.Year(2025).walk("decades10", where={"months": [1]}))
+    assert [d.index for d in decades] == [1, 2, 3]
+    assert len(list(gt.Month(2025, 10).walk("decades10"))) == 3
+    assert gt.Month(2025, 2).get("decades10")[-1].end_date == date(2025, 2, 28)
@@ -0,0 +1,69 @@
+# test/test_fixed_units.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from datetime import datetime, date
+import gridtime as gt
+
+Minutes5 = gt.fixed_resolution_unit(5)
+HalfHour = gt.fixed_resolution_unit(30, "halfhours30", children_key="minutes5", name="HalfHour")
+
+
+@pytest.mark.parametrize(
+    "day, halfhours, fives",
+    [
+        (date(2025, 3, 30), 46, 276),
+        (date(2025, 10, 26), 50, 300),
+        (date(2025, 6, 1), 48, 288),
+    ],
+)
+def test_dst_aware_slot_counts(day, halfhours, fives):
+    d = gt.Day(day)
+    assert len(HalfHour.slots(d)) == halfhours
+    assert len(d.slot_range("minutes5")) == fives
+
+
+def test_step_is_chronological_across_duplicate():
+    h = HalfHour(datetime(2025, 10, 26, 2, 30))              # ↑1st
+    assert (h.next().start_time.minute, h.next().is_backward) == (0, True)
+    assert h.shift(3).start_time == datetime(2025, 10, 26, 3, 0)
+    assert h.shift(3).shift(-3).ordinal() == h.ordinal()
+
+    before = HalfHour(datetime(2025, 3, 30, 1, 30))
+    assert before.next().start_time == datetime(2025, 3, 30, 3, 0)
+
+
+def test_lazy_children_and_hour_alignment():
+    h = HalfHour(datetime(2025, 10, 26, 2, 0), is_backward=True)
+    assert h._children is None
+    assert h.count("minutes5") == 6
+    assert all(m.is_backward for m in h)
+    hour = gt.Hour(datetime(2025, 10, 26, 3, 0), is_backward=True)
+    assert h.slot_range("minutes5").start == hour.slot_range("minutes5").start
+
+
+def test_factory_validation():
+    assert gt.fixed_resolution_unit(5) is Minutes5
+    with pytest.raises(ValueError):
+        gt.fixed_resolution_unit(7)
+    with pytest.raises(ValueError):
+        gt.fixed_resolution_unit(60, "hours")
+    with pytest.raises(ValueError):
+        HalfHour(datetime(2025, 3, 30, 2, 30))
+
+
+def test_calendar_nodes_accept_fixed_units():
+    d = gt.Day(date(2025, 10, 26))
+    assert d.count("minutes5") == 300
+    assert gt.Month(2025, 3).count("halfhours30") == 743 * 2
+    fives = d.get("minutes5")
+    assert len(fives) == 300 and fives[0].start_time == datetime(2025, 10, 26, 0, 0)
+    assert sum(1 for m in d.walk("minutes5") if m.is_backward) == 12
+    evening = list(d.walk("halfhours30", where={"hours": [22, 23]}))
+    assert [h.start_time.minute for h in evening] == [0, 30, 0, 30]
+    assert gt.QuarterHour(datetime(2025, 1, 1, 0, 0)).count("minutes5") == 3
+    with pytest.raises(ValueError):
+        gt.QuarterHour(datetime(2025, 1, 1, 0, 0)).count("halfhours30")
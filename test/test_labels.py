@@ -0,0 +1,45 @@
+# test/test_labels.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import io
+import pytest
+from datetime import datetime, date
+import gridtime as gt
+
+
+def test_repr_dialect_matches_object_repr():
+    month = gt.Month(2025, 10)
+    assert gt.format_labels(month, "quarters15") == [repr(q) for q in month.walk("quarters15")]
+    march = gt.Day(date(2025, 3, 30))
+    assert gt.format_labels(march, "hours") == [repr(h) for h in march.walk("hours")]
+
+
+def test_iso_dialect_offsets_on_fall_day():
+    labels = gt.format_labels(gt.Day(date(2025, 10, 26)), "hours", dialect="iso")
+    assert labels[2] == "2025-10-26T02:00+02:00/2025-10-26T02:00+01:00"
+    assert labels[3] == "2025-10-26T02:00+01:00/2025-10-26T03:00+01:00"
+    assert labels[-1] == "2025-10-26T23:00+01:00/2025-10-27T00:00+01:00"
+
+
+def test_pse_dialect_and_partial_ranges():
+    hour = gt.Hour(datetime(2025, 10, 26, 3, 0), is_backward=True)
+    assert gt.format_labels(hour, "quarters15", dialect="pse") == [
+        "2025-10-26;13", "2025-10-26;14", "2025-10-26;15", "2025-10-26;16",
+    ]
+
+
+def test_output_to_list_and_buffer():
+    day = gt.Day(date(2025, 1, 1))
+    labels = ["naglowek"]
+    assert gt.format_labels(day, out=labels) is labels
+    assert len(labels) == 25
+
+    buffer = io.StringIO()
+    assert gt.format_labels(gt.Week(2025, 1), "quarters15", out=buffer) == 7 * 96
+    assert buffer.getvalue().splitlines()[0] == "2024-12-30 00:00-00:15"
+
+    with pytest.raises(ValueError):
+        gt.format_labels(day, dialect="csv")
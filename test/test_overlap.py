@@ -0,0 +1,38 @@
+# test/test_overlap.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from datetime import date
+import gridtime as gt
+from gridtime.gridtime import MonthDecade
+
+
+def test_week_month_weights_include_dst():
+    weights = gt.overlap_weights("weeks", "months", date(2025, 10, 1), date(2025, 11, 1))
+    week44 = gt.Week(2025, 44)                       # 27.10 – 2.11
+    assert weights[(gt.Week(2025, 43), gt.Month(2025, 10))] == 7 * 24 + 1
+    assert weights[(week44, gt.Month(2025, 10))] == 5 * 24
+    assert (week44, gt.Month(2025, 11)) not in weights      # poza zakresem [start, stop)
+    assert sum(weights.values()) == 745
+
+
+def test_normalized_week_split_across_months():
+    weights = gt.overlap_weights(
+        "weeks", "months", date(2025, 3, 1), date(2025, 5, 1), resolution="quarters15", normalize=True,
+    )
+    week14 = gt.Week(2025, 14)                       # 31.03 – 6.04
+    assert weights[(week14, gt.Month(2025, 3))] == 96 / (7 * 96)
+    assert weights[(week14, gt.Month(2025, 4))] == 6 * 96 / (7 * 96)
+
+
+def test_season_year_and_decades():
+    weights = gt.overlap_weights("seasons", "years", date(2024, 1, 1), date(2026, 1, 1))
+    winter = gt.Season(2024, "W")
+    assert weights[(winter, gt.Year(2024))] == 92 * 24 + 1
+    assert weights[(winter, gt.Year(2025))] == 90 * 24 - 1
+    assert len(weights) == 6                        # W23, S24, W24×2, S25, W25
+
+    decades = gt.overlap_weights("weeks", "decades10", date(2025, 10, 1), date(2025, 11, 1))
+    assert decades[(gt.Week(2025, 43), MonthDecade(2025, 10, 3))] == 6 * 24 + 1
@@ -0,0 +1,56 @@
+# test/test_rolling.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import math
+import random
+import pytest
+from datetime import date
+import gridtime as gt
+
+
+def _naive(values, window, func):
+    return [func(values[max(0, i - window + 1):i + 1]) for i in range(len(values))]
+
+
+@pytest.mark.parametrize("how, func", [
+    ("sum", sum),
+    ("min", min),
+    ("max", max),
+    ("mean", lambda w: sum(w) / len(w)),
+])
+def test_rolling_matches_naive(how, func):
+    random.seed(7)
+    values = [random.randint(-50, 50) for _ in range(500)]
+    assert gt.rolling(values, 16, how, min_periods=1) == _naive(values, 16, func)
+
+
+def test_float_sum_does_not_drift():
+    # duże wartości wchodzące i wychodzące z okna – suma bieżąca gubiłaby resztki
+    values = [1e8 if i % 97 == 0 else 0.1 for i in range(100_000)]
+    out = gt.rolling(values, 96, "sum")
+    assert max(
+        abs(out[i] - math.fsum(values[i - 95:i + 1])) for i in range(95, len(values))
+    ) < 1e-7
+    means = gt.rolling(values, 96, "mean", min_periods=1)
+    assert means[-1] == pytest.approx(math.fsum(values[-96:]) / 96, abs=1e-12)
+
+
+def test_window_counts_slots_on_dst_day():
+    day = gt.Day(date(2025, 10, 26))
+    window = gt.window_slots(4, "hours")
+    assert window == 16
+    out = gt.rolling([1] * 100, window, over=day, unit="quarters15")
+    assert out[:15] == [None] * 15
+    assert out[15:] == [16] * 85
+    assert gt.window_slots(7, "days") == 672
+
+
+def test_custom_function_and_validation():
+    assert gt.rolling([1, 2, 3, 4], 2, lambda w: w[-1] - w[0]) == [None, 1, 1, 1]
+    with pytest.raises(ValueError):
+        gt.rolling([1] * 10, 4, over=gt.Day(date(2025, 1, 1)), unit="hours")
+    with pytest.raises(ValueError):
+        gt.rolling([1, 2], 2, "median")
@@ -0,0 +1,49 @@
+# test/test_slots.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from datetime import datetime, date
+import gridtime as gt
+
+
+@pytest.mark.parametrize(
+    "day, hours, quarters",
+    [
+        (date(2025, 3, 30), 23, 92),
+        (date(2025, 10, 26), 25, 100),
+        (date(2025, 6, 1), 24, 96),
+    ],
+)
+def test_day_slot_range_matches_tree(day, hours, quarters):
+    d = gt.Day(day)
+    assert [h.ordinal() for h in d.get("hours")] == list(d.slot_range("hours"))
+    assert [q.ordinal() for q in d.get("quarters15")] == list(d.slot_range("quarters15"))
+    assert len(d.slot_range("hours")) == hours
+    assert len(d.slot_range("quarters15")) == quarters
+
+
+def test_duplicated_hour_owns_its_quarters():
+    h2 = gt.Hour(datetime(2025, 10, 26, 3, 0), is_backward=True)   # ↓2nd
+    quarters = list(h2)
+    assert len(quarters) == 4
+    assert all(q.is_backward for q in quarters)
+    assert [q.ordinal() for q in quarters] == list(h2.slot_range("quarters15"))
+
+
+def test_from_ordinal_roundtrip():
+    for o in gt.Day(date(2025, 10, 26)).slot_range("hours"):
+        h = gt.Hour.from_ordinal(o)
+        assert h.ordinal() == o
+
+
+def test_year_slot_counts():
+    assert len(gt.Year(2024).slot_range("hours")) == 8784
+    assert len(gt.Year(2025).slot_range("quarters15")) == 35040
+
+
+def test_missing_slot_has_no_ordinal():
+    with pytest.raises(ValueError):
+        gt.slot_ordinal(datetime(2025, 3, 30, 2, 15), minutes=15)
@@ -0,0 +1,49 @@
+# test/test_slotset.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+import pytest
+from datetime import datetime, date
+import gridtime as gt
+
+
+def test_algebra_matches_python_sets():
+    random.seed(3)
+    for _ in range(50):
+        a = {random.randrange(200) for _ in range(60)}
+        b = {random.randrange(200) for _ in range(60)}
+        sa, sb = gt.SlotSet.from_ordinals(a, "hours"), gt.SlotSet.from_ordinals(b, "hours")
+        assert set((sa | sb).ordinals()) == a | b
+        assert set((sa & sb).ordinals()) == a & b
+        assert set((sa - sb).ordinals()) == a - b
+        assert len(sa) == len(a)
+
+
+def test_from_units_without_enumeration():
+    season = gt.SlotSet.from_unit(gt.Season(2025, "W"), "hours")
+    assert len(season.runs) == 1
+    october = gt.SlotSet.from_unit(gt.Month(2025, 10), "hours")
+    assert len(october) == 745
+    assert (season & october) == october
+
+    outage = gt.SlotSet.from_unit(gt.Day(date(2025, 10, 26)), "hours")
+    available = october - outage
+    assert len(available.runs) == 2 and len(available) == 720
+    assert not available.covers(gt.Day(date(2025, 10, 26)))
+    assert available.covers(gt.Week(2025, 42))
+
+
+def test_membership_and_iteration():
+    day = gt.SlotSet.from_unit(gt.Day(date(2025, 10, 26)), "quarters15")
+    second = gt.QuarterHour(datetime(2025, 10, 26, 2, 45), is_backward=True)
+    assert second in day
+    assert gt.QuarterHour(datetime(2025, 10, 27, 0, 0)) not in day
+    assert [repr(q) for q in day] == [repr(q) for q in gt.Day(date(2025, 10, 26)).walk("quarters15")]
+
+
+def test_mixed_units_rejected():
+    with pytest.raises(ValueError):
+        gt.SlotSet(unit="hours") | gt.SlotSet(unit="quarters15")
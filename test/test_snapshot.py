@@ -0,0 +1,79 @@
+# test/test_snapshot.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from datetime import date
+import gridtime as gt
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = str(tmp_path / "calendar.gts")
+    gt.build_snapshot(path, range(2024, 2027), [gt.TARIFFS["G12w"], gt.TARIFFS["C22a"]])
+    snap = gt.load_snapshot(path)
+    gt.use_snapshot(snap)
+    yield snap
+    gt.use_snapshot(None)
+    snap.close()
+
+
+def test_snapshot_roundtrip(snapshot):
+    assert snapshot.years == range(2024, 2027)
+    assert snapshot.dst_transition_days(2025) == (date(2025, 3, 30), date(2025, 10, 26))
+    assert snapshot.holidays(2025) == gt.holidays._compute_polish_holidays(2025)
+    assert snapshot.tariff_names() == ["C22a", "G12w"]
+
+
+def test_tariff_masks_read_from_snapshot(snapshot):
+    compiled = gt.TARIFFS["G12w"].compile()
+    mask = compiled.year_mask(2025)
+    assert isinstance(mask, memoryview)
+    assert bytes(mask) == compiled._build_year(2025)
+    assert compiled.zone_counts(gt.Day(date(2025, 11, 11))) == {"dzienna": 0, "nocna": 96}
+
+    # inna rozdzielczość lub rok spoza snapshotu – liczone na bieżąco
+    assert isinstance(gt.TARIFFS["G12w"].compile("hours").year_mask(2025), bytes)
+    assert isinstance(compiled.year_mask(2030), bytes)
+
+
+def test_custom_tariff_with_same_name_is_not_matched(snapshot):
+    custom = gt.Tariff("G12w", default_zone="całodobowa")
+    assert snapshot.tariff_mask(custom, 15, 2025) is None
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        gt.load_snapshot(str(path))
+
+
+def test_close_after_compiled_tariffs_used_it(tmp_path):
+    path = str(tmp_path / "calendar.gts")
+    gt.build_snapshot(path, [2025], [gt.TARIFFS["G12w"]])
+    snap = gt.load_snapshot(path)
+    gt.use_snapshot(snap)
+    compiled = gt.TARIFFS["G12w"].compile()
+    counts = compiled.zone_counts(gt.Month(2025, 2))
+    assert isinstance(compiled.year_mask(2025), memoryview)
+
+    gt.use_snapshot(None)
+    assert isinstance(compiled.year_mask(2025), bytes)       # maska liczona od nowa
+    snap.close()
+    assert compiled.zone_counts(gt.Month(2025, 2)) == counts
+    with pytest.raises(ValueError):
+        snap.holidays(2025)
+
+
+def test_close_detaches_while_views_are_alive(tmp_path):
+    path = str(tmp_path / "calendar.gts")
+    gt.build_snapshot(path, [2025], [gt.TARIFFS["G12w"]])
+    snap = gt.load_snapshot(path)
+    gt.use_snapshot(snap)
+    mask = gt.TARIFFS["G12w"].compile().year_mask(2025)
+    snap.close()                                               # bez BufferError
+    assert gt.active_snapshot() is None
+    assert bytes(mask[:4]) == gt.TARIFFS["G12w"].compile()._build_year(2025)[:4]
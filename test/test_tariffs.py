@@ -0,0 +1,46 @@
+# test/test_tariffs.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from datetime import datetime, date
+import gridtime as gt
+
+
+def test_polish_holidays_2025():
+    holidays = gt.polish_holidays(2025)
+    assert date(2025, 4, 20) in holidays          # Wielkanoc
+    assert date(2025, 6, 19) in holidays          # Boże Ciało
+    assert date(2025, 12, 24) in holidays         # Wigilia (od 2025)
+    assert date(2024, 12, 24) not in gt.polish_holidays(2024)
+
+
+def test_g12_follows_winter_clock():
+    g12 = gt.TARIFFS["G12"].compile("hours")
+    # 13:00–15:00 CET  ➜ latem 14:00–16:00 czasu lokalnego
+    assert g12.zone_of(gt.Hour(datetime(2025, 1, 15, 14))) == "nocna"   # 13:00–14:00
+    assert g12.zone_of(gt.Hour(datetime(2025, 7, 15, 14))) == "dzienna"  # 13:00–14:00 CEST
+    assert g12.zone_of(gt.Hour(datetime(2025, 7, 15, 16))) == "nocna"   # 15:00–16:00 CEST
+
+
+def test_g12w_weekend_and_holiday_are_off_peak():
+    g12w = gt.TARIFFS["G12w"].compile()
+    assert set(g12w.zone_array(gt.Day(date(2025, 11, 11)))) == {"nocna"}   # wtorek, święto
+    assert g12w.zone_counts(gt.Day(date(2025, 11, 12))) == {"dzienna": 56, "nocna": 40}
+
+
+def test_mask_matches_direct_classification():
+    tariff = gt.TARIFFS["C22a"]
+    compiled = tariff.compile()
+    day = gt.Day(date(2025, 10, 26))
+    expected = [tariff.zone_at(q.start_time, q.is_backward) for q in day.walk("quarters15")]
+    assert compiled.zone_array(day) == expected
+    assert len(compiled.year_mask(2025)) == 35040
+
+
+def test_zone_of_rejects_other_unit():
+    compiled = gt.TARIFFS["G11"].compile("quarters15")
+    with pytest.raises(ValueError):
+        compiled.zone_of(gt.Hour(datetime(2025, 1, 1, 1)))
@@ -0,0 +1,52 @@
+# test/test_threading.py
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import pytest
+import gridtime as gt
+
+
+@pytest.fixture
+def fast_switching():
+    # bez cache węzłów – każda materializacja tworzy nowe instancje
+    interval, maxsize = sys.getswitchinterval(), gt.node_cache.maxsize
+    sys.setswitchinterval(1e-6)
+    gt.node_cache.resize(0)
+    yield
+    sys.setswitchinterval(interval)
+    gt.node_cache.resize(maxsize)
+
+
+def test_shared_year_is_materialised_once(fast_switching):
+    year = gt.Year(2025)
+    workers = 16
+    barrier = threading.Barrier(workers)
+
+    def handler(_):
+        barrier.wait()
+        days = [id(d) for d in year.walk("days")]
+        quarters = sum(1 for _ in year.walk("quarters15", where={"months": (3, 10)}))
+        return days, quarters
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(handler, range(workers)))
+
+    first_days, first_quarters = results[0]
+    assert len(first_days) == 365
+    assert first_quarters == (31 + 31) * 96
+    assert all(days == first_days for days, _ in results)
+    assert all(quarters == first_quarters for _, quarters in results)
+
+
+def test_concurrent_lazy_children_of_one_node(fast_switching):
+    for _ in range(20):
+        day = gt.Day(date(2025, 10, 26))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            seen = list(pool.map(lambda _: tuple(map(id, day)), range(8)))
+        assert len(set(seen)) == 1
+        assert len(seen[0]) == 25